@@ -74,6 +74,7 @@ a = Analysis(
         'pandas',
         'numpy',
         'openpyxl',
+        'xlsxwriter',
         'yaml',
         'jsonschema',
         
@@ -14,7 +14,7 @@ if str(src_dir) not in sys.path:
 
 if __name__ == '__main__':
     # Run the advanced GUI as a module to properly handle relative imports
-    import subprocess
+    import runpy
     import os
     
     # Change to project directory and run as module
@@ -22,8 +22,8 @@ if __name__ == '__main__':
     os.chdir(project_dir)
     
     try:
-        # Use python -m to run as module - this properly handles relative imports
-        subprocess.run([sys.executable, '-m', 'src.advanced_gui'])
+        # Run in-process with python -m semantics instead of spawning a second interpreter
+        runpy.run_module('src.advanced_gui', run_name='__main__', alter_sys=True)
     except Exception as e:
         print(f"Failed to start advanced GUI: {e}")
         print("Please run from project root: python -m src.advanced_gui")
\ No newline at end of file
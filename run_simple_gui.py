@@ -14,7 +14,7 @@ if str(src_dir) not in sys.path:
 
 if __name__ == '__main__':
     # Run the simple GUI as a module to maintain consistency
-    import subprocess
+    import runpy
     import os
     
     # Change to project directory and run as module
@@ -22,8 +22,8 @@ if __name__ == '__main__':
     os.chdir(project_dir)
     
     try:
-        # Use python -m to run as module
-        subprocess.run([sys.executable, '-m', 'src.simple_gui'])
+        # Run in-process with python -m semantics instead of spawning a second interpreter
+        runpy.run_module('src.simple_gui', run_name='__main__', alter_sys=True)
     except Exception as e:
         print(f"Failed to start simple GUI: {e}")
         print("Please run from project root: python -m src.simple_gui")
\ No newline at end of file
@@ -4,6 +4,7 @@ Advanced GUI for impedance control tool with configuration editing capabilities
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add current directory and parent directory to Python path for module imports
@@ -24,24 +25,91 @@ if str(parent_dir) not in sys.path:
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
     QTabWidget, QMenuBar, QMenu, QAction, QStatusBar, QSplitter,
-    QMessageBox, QProgressBar, QLabel, QToolBar
+    QMessageBox, QProgressBar, QLabel, QToolBar, QFileDialog
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtGui import QIcon, QKeySequence
 
-# Import models and controllers
+from widgets.file_dialog import FILE_DIALOG_OPTIONS
+
+# Import models; controllers and view widgets are imported where first used
 from models.configuration_model import ConfigurationModel
-from controllers.configuration_controller import ConfigurationController
-from controllers.signal_rule_controller import SignalRuleController
-from controllers.layout_rule_controller import LayoutRuleController
-from controllers.template_mapping_controller import TemplateMappingController
 
-# Import view widgets
-from views.signal_rule_editor import SignalRuleEditor
-from views.layout_rule_editor import LayoutRuleEditor
-from views.template_mapping_editor import TemplateMappingEditor
-from views.netlist_processor import NetlistProcessor
-from widgets.help_panel import HelpPanel
+
+# Dark theme stylesheet, built once at import time
+DARK_STYLESHEET = """
+    QMainWindow {
+        background-color: #2e2e2e;
+        color: #f0f0f0;
+    }
+    QWidget {
+        background-color: #2e2e2e;
+        color: #f0f0f0;
+        font-family: "Microsoft YaHei", "微軟雅黑";
+    }
+    QTabWidget::pane {
+        border: 1px solid #555555;
+        background-color: #3c3c3c;
+    }
+    QTabBar::tab {
+        background-color: #444444;
+        color: #f0f0f0;
+        padding: 8px 15px;
+        margin: 2px;
+        border-radius: 3px;
+    }
+    QTabBar::tab:selected {
+        background-color: #555555;
+    }
+    QTabBar::tab:hover {
+        background-color: #666666;
+    }
+    QMenuBar {
+        background-color: #3c3c3c;
+        color: #f0f0f0;
+        border-bottom: 1px solid #555555;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 4px 8px;
+    }
+    QMenuBar::item:selected {
+        background-color: #555555;
+    }
+    QMenu {
+        background-color: #3c3c3c;
+        color: #f0f0f0;
+        border: 1px solid #555555;
+    }
+    QMenu::item:selected {
+        background-color: #555555;
+    }
+    QToolBar {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        color: #f0f0f0;
+    }
+    QStatusBar {
+        background-color: #3c3c3c;
+        color: #f0f0f0;
+        border-top: 1px solid #555555;
+    }
+    QSplitter::handle {
+        background-color: #555555;
+    }
+    QTableWidget {
+        background-color: #3c3c3c;
+        color: #f0f0f0;
+        gridline-color: #555555;
+    }
+    QTableWidget QHeaderView::section {
+        background-color: #404040;
+        color: white;
+        border: 1px solid #666666;
+        padding: 6px;
+        font-weight: bold;
+    }
+"""
 
 
 class AdvancedImpedanceControlGUI(QMainWindow):
@@ -53,6 +121,11 @@ class AdvancedImpedanceControlGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         
+        from controllers.configuration_controller import ConfigurationController
+        from controllers.signal_rule_controller import SignalRuleController
+        from controllers.layout_rule_controller import LayoutRuleController
+        from controllers.template_mapping_controller import TemplateMappingController
+        
         # Initialize models and controllers
         self.config_model = ConfigurationModel()
         self.config_controller = ConfigurationController(self.config_model)
@@ -65,11 +138,17 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         self.setup_connections()
         self.update_window_title()
         
-        # Status tracking
-        self.progress_bar = None
+        # Status tracking (progress bar is created in create_status_bar)
         self.status_timer = QTimer()
         self.status_timer.setSingleShot(True)
         self.status_timer.timeout.connect(self.clear_status_message)
+        
+        # Coalesce bursts of status messages into one repaint per 50 ms
+        self._pending_status = None
+        self._status_debounce = QTimer()
+        self._status_debounce.setSingleShot(True)
+        self._status_debounce.setInterval(50)
+        self._status_debounce.timeout.connect(self._flush_status_message)
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -98,22 +177,25 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         # File menu
         file_menu = menubar.addMenu('檔案(&F)')
         
-        new_action = QAction('新增配置(&N)', self)
-        new_action.setShortcut(QKeySequence.New)
-        new_action.triggered.connect(self.config_controller.create_new_config)
-        file_menu.addAction(new_action)
+        self.new_action = QAction('新增配置(&N)', self)
+        self.new_action.setIconText('新增')
+        self.new_action.setShortcut(QKeySequence.New)
+        self.new_action.triggered.connect(self.config_controller.create_new_config)
+        file_menu.addAction(self.new_action)
         
-        open_action = QAction('開啟配置(&O)', self)
-        open_action.setShortcut(QKeySequence.Open)
-        open_action.triggered.connect(lambda: self.config_controller.load_config_file())
-        file_menu.addAction(open_action)
+        self.open_action = QAction('開啟配置(&O)', self)
+        self.open_action.setIconText('開啟')
+        self.open_action.setShortcut(QKeySequence.Open)
+        self.open_action.triggered.connect(lambda: self.config_controller.load_config_file_async())
+        file_menu.addAction(self.open_action)
         
         file_menu.addSeparator()
         
-        save_action = QAction('儲存(&S)', self)
-        save_action.setShortcut(QKeySequence.Save)
-        save_action.triggered.connect(lambda: self.config_controller.save_config_file())
-        file_menu.addAction(save_action)
+        self.save_action = QAction('儲存(&S)', self)
+        self.save_action.setIconText('儲存')
+        self.save_action.setShortcut(QKeySequence.Save)
+        self.save_action.triggered.connect(lambda: self.config_controller.save_config_file())
+        file_menu.addAction(self.save_action)
         
         save_as_action = QAction('另存新檔(&A)', self)
         save_as_action.setShortcut(QKeySequence.SaveAs)
@@ -130,22 +212,25 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         # Edit menu
         edit_menu = menubar.addMenu('編輯(&E)')
         
-        undo_action = QAction('復原(&U)', self)
-        undo_action.setShortcut(QKeySequence.Undo)
-        undo_action.triggered.connect(self.config_controller.undo)
-        edit_menu.addAction(undo_action)
+        self.undo_action = QAction('復原(&U)', self)
+        self.undo_action.setIconText('復原')
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.config_controller.undo)
+        edit_menu.addAction(self.undo_action)
         
-        redo_action = QAction('重做(&R)', self)
-        redo_action.setShortcut(QKeySequence.Redo)
-        redo_action.triggered.connect(self.config_controller.redo)
-        edit_menu.addAction(redo_action)
+        self.redo_action = QAction('重做(&R)', self)
+        self.redo_action.setIconText('重做')
+        self.redo_action.setShortcut(QKeySequence.Redo)
+        self.redo_action.triggered.connect(self.config_controller.redo)
+        edit_menu.addAction(self.redo_action)
         
         edit_menu.addSeparator()
         
-        validate_action = QAction('驗證配置(&V)', self)
-        validate_action.setShortcut('Ctrl+Shift+V')
-        validate_action.triggered.connect(self.config_controller.validate_all_rules)
-        edit_menu.addAction(validate_action)
+        self.validate_action = QAction('驗證配置(&V)', self)
+        self.validate_action.setIconText('驗證')
+        self.validate_action.setShortcut('Ctrl+Shift+V')
+        self.validate_action.triggered.connect(self.config_controller.validate_all_rules)
+        edit_menu.addAction(self.validate_action)
         
         reset_action = QAction('重設為預設值(&D)', self)
         reset_action.triggered.connect(self.confirm_reset_to_defaults)
@@ -166,36 +251,25 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         help_menu.addAction(about_action)
     
     def create_toolbar(self):
-        """Create the toolbar"""
+        """Create the toolbar, sharing the menu bar's actions"""
         toolbar = self.addToolBar('主要工具列')
         toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
         
-        # New config
-        new_action = toolbar.addAction('新增')
-        new_action.triggered.connect(self.config_controller.create_new_config)
-        
-        # Open config
-        open_action = toolbar.addAction('開啟')
-        open_action.triggered.connect(lambda: self.config_controller.load_config_file())
-        
-        # Save config
-        save_action = toolbar.addAction('儲存')
-        save_action.triggered.connect(lambda: self.config_controller.save_config_file())
+        # New / Open / Save config
+        toolbar.addAction(self.new_action)
+        toolbar.addAction(self.open_action)
+        toolbar.addAction(self.save_action)
         
         toolbar.addSeparator()
         
         # Validate
-        validate_action = toolbar.addAction('驗證')
-        validate_action.triggered.connect(self.config_controller.validate_all_rules)
+        toolbar.addAction(self.validate_action)
         
         toolbar.addSeparator()
         
         # Undo/Redo
-        undo_action = toolbar.addAction('復原')
-        undo_action.triggered.connect(self.config_controller.undo)
-        
-        redo_action = toolbar.addAction('重做')
-        redo_action.triggered.connect(self.config_controller.redo)
+        toolbar.addAction(self.undo_action)
+        toolbar.addAction(self.redo_action)
     
     def create_central_widget(self):
         """Create the central widget with tabs"""
@@ -209,6 +283,8 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         splitter = QSplitter(Qt.Horizontal)
         main_layout.addWidget(splitter)
         
+        from widgets.help_panel import HelpPanel
+        
         # Help panel (left panel)
         self.help_panel = HelpPanel()
         self.help_panel.navigateToTab.connect(self.handle_navigation_request)
@@ -218,45 +294,100 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         splitter.addWidget(self.tab_widget)
         
-        # Create editor tabs
-        self.create_editor_tabs()
-        
         # Connect tab change signal
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
+        # Build editor tabs on the next event-loop tick so the window paints first
+        self._tab_index = {}
+        QTimer.singleShot(0, self.create_editor_tabs)
+        
         # Set splitter proportions
         splitter.setSizes([300, 1100])
     
     def create_editor_tabs(self):
-        """Create the editor tabs"""
+        """Create the editor tabs; each editor is built on first activation"""
+        self._tab_factories = [
+            (self._build_signal_editor, "信號規則"),
+            (self._build_layout_editor, "佈局規則"),
+            (self._build_template_editor, "模板設定"),
+            (self._build_netlist_processor, "Netlist處理")
+        ]
+        self._tab_built = [False] * len(self._tab_factories)
+        self._tab_index = {tab_name: index for index, (_, tab_name) in enumerate(self._tab_factories)}
+        self._tab_placeholders = []
+        
+        for _, tab_name in self._tab_factories:
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_placeholders.append(placeholder)
+            self.tab_widget.addTab(placeholder, tab_name)
+        
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+    
+    def _ensure_tab_built(self, index: int):
+        """Build the editor for the tab at index if it has not been built yet"""
+        if not 0 <= index < len(self._tab_placeholders) or self._tab_built[index]:
+            return
+        
+        self._tab_built[index] = True
+        factory, _ = self._tab_factories[index]
+        placeholder = self._tab_placeholders[index]
+        with self._frozen(placeholder):
+            placeholder.layout().addWidget(factory())
+    
+    @staticmethod
+    @contextmanager
+    def _frozen(widget):
+        """Suspend repaints and signals of widget while it is being populated"""
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            yield widget
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
+            widget.update()
+    
+    def _build_signal_editor(self):
+        """Signal Rules Editor"""
+        from views.signal_rule_editor import SignalRuleEditor
         
-        # Signal Rules Editor
         self.signal_editor = SignalRuleEditor(
             self.config_model.signal_rules,
             self.signal_rule_controller
         )
-        self.tab_widget.addTab(self.signal_editor, "信號規則")
+        return self.signal_editor
+    
+    def _build_layout_editor(self):
+        """Layout Rules Editor"""
+        from views.layout_rule_editor import LayoutRuleEditor
         
-        # Layout Rules Editor
         self.layout_editor = LayoutRuleEditor(
             self.config_model.layout_rules,
             self.layout_rule_controller
         )
-        self.tab_widget.addTab(self.layout_editor, "佈局規則")
+        return self.layout_editor
+    
+    def _build_template_editor(self):
+        """Template Mapping Editor"""
+        from views.template_mapping_editor import TemplateMappingEditor
         
-        # Template Mapping Editor
         self.template_editor = TemplateMappingEditor(
             self.config_model.template_mapping,
             self.template_controller
         )
-        self.tab_widget.addTab(self.template_editor, "模板設定")
+        return self.template_editor
+    
+    def _build_netlist_processor(self):
+        """Netlist Processor"""
+        from views.netlist_processor import NetlistProcessor
         
-        # Netlist Processor
         self.netlist_processor = NetlistProcessor(
             self.config_model,
             self.config_controller
         )
-        self.tab_widget.addTab(self.netlist_processor, "Netlist處理")
+        return self.netlist_processor
     
     def create_status_bar(self):
         """Create the status bar"""
@@ -280,41 +411,57 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         self.config_controller.errorOccurred.connect(self.on_error_occurred)
         self.config_controller.validationCompleted.connect(self.on_validation_completed)
         self.config_controller.operationProgress.connect(self.on_operation_progress)
+        self.config_controller.busyChanged.connect(self.on_busy_changed)
         
         # Model change signals
         self.config_model.dataChanged.connect(self.on_config_changed)
     
+    @pyqtSlot(str)
     def on_config_loaded(self, config_path: str):
         """Handle configuration loaded"""
         self.update_window_title()
         self.config_status_label.setText(f"配置: {Path(config_path).name}")
         self.show_status_message(f"配置已載入: {config_path}", 3000)
     
+    @pyqtSlot(str)
     def on_config_saved(self, config_path: str):
         """Handle configuration saved"""
         self.update_window_title()
         self.config_status_label.setText(f"配置: {Path(config_path).name}")
         self.show_status_message(f"配置已儲存: {config_path}", 3000)
     
+    @pyqtSlot(str)
     def on_error_occurred(self, error_message: str):
         """Handle error occurred"""
         QMessageBox.critical(self, "錯誤", error_message)
         self.show_status_message(f"錯誤: {error_message}", 5000)
     
+    @pyqtSlot(bool, list)
     def on_validation_completed(self, success: bool, errors: list):
         """Handle validation completed"""
         if success:
             QMessageBox.information(self, "驗證結果", "配置驗證通過！")
             self.show_status_message("配置驗證通過", 3000)
         else:
-            error_text = "\\n".join(errors)
+            # Only render a preview; the full list can be arbitrarily long
+            error_text = "\\n".join(errors[:20])
+            if len(errors) > 20:
+                error_text += f"\\n... 還有 {len(errors) - 20} 個錯誤"
             QMessageBox.warning(self, "驗證失敗", f"發現以下錯誤:\\n\\n{error_text}")
             self.show_status_message(f"驗證失敗，發現 {len(errors)} 個錯誤", 5000)
     
+    @pyqtSlot(str)
     def on_operation_progress(self, message: str):
         """Handle operation progress"""
         self.show_status_message(message, 2000)
     
+    @pyqtSlot(bool)
+    def on_busy_changed(self, busy: bool):
+        """Show an indeterminate progress bar while a background operation runs"""
+        self.progress_bar.setRange(0, 0 if busy else 100)
+        self.progress_bar.setVisible(busy)
+    
+    @pyqtSlot()
     def on_config_changed(self):
         """Handle configuration data changed"""
         self.update_window_title()
@@ -332,7 +479,18 @@ class AdvancedImpedanceControlGUI(QMainWindow):
             self.setWindowTitle(f"{base_title} - 未命名{modified_indicator}")
     
     def show_status_message(self, message: str, timeout: int = 2000):
-        """Show a status message"""
+        """Show a status message; only the latest message in a burst is painted"""
+        self._pending_status = (message, timeout)
+        if not self._status_debounce.isActive():
+            self._status_debounce.start()
+    
+    def _flush_status_message(self):
+        """Show the most recent pending status message"""
+        if self._pending_status is None:
+            return
+        
+        message, timeout = self._pending_status
+        self._pending_status = None
         self.status_bar.showMessage(message, timeout)
         
         # Auto-clear after timeout
@@ -357,12 +515,11 @@ class AdvancedImpedanceControlGUI(QMainWindow):
     
     def export_config_summary(self):
         """Export configuration summary"""
-        from PyQt5.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "匯出配置摘要",
             str(Path.home() / "impedance_config_summary.json"),
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         if file_path:
@@ -413,100 +570,32 @@ class AdvancedImpedanceControlGUI(QMainWindow):
         else:
             event.accept()
     
+    @pyqtSlot(int)
     def on_tab_changed(self, index):
-        """Handle tab change to update help panel"""
+        """Handle tab change to build the editor and update help panel"""
         if index >= 0:
+            self._ensure_tab_built(index)
             tab_name = self.tab_widget.tabText(index)
             self.help_panel.set_context_from_tab(tab_name)
     
     def handle_navigation_request(self, target):
         """Handle navigation requests from help panel"""
         if target == "load_config":
-            self.config_controller.load_config_file()
+            self.config_controller.load_config_file_async()
         elif target == "validate_config":
             self.config_controller.validate_all_rules()
         else:
             # Navigate to specific tab
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabText(i) == target:
-                    self.tab_widget.setCurrentIndex(i)
-                    break
+            index = self._tab_index.get(target)
+            if index is not None:
+                self.tab_widget.setCurrentIndex(index)
     
     def apply_dark_theme(self):
         """Apply dark theme to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2e2e2e;
-                color: #f0f0f0;
-            }
-            QWidget {
-                background-color: #2e2e2e;
-                color: #f0f0f0;
-                font-family: "Microsoft YaHei", "微軟雅黑";
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #3c3c3c;
-            }
-            QTabBar::tab {
-                background-color: #444444;
-                color: #f0f0f0;
-                padding: 8px 15px;
-                margin: 2px;
-                border-radius: 3px;
-            }
-            QTabBar::tab:selected {
-                background-color: #555555;
-            }
-            QTabBar::tab:hover {
-                background-color: #666666;
-            }
-            QMenuBar {
-                background-color: #3c3c3c;
-                color: #f0f0f0;
-                border-bottom: 1px solid #555555;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 4px 8px;
-            }
-            QMenuBar::item:selected {
-                background-color: #555555;
-            }
-            QMenu {
-                background-color: #3c3c3c;
-                color: #f0f0f0;
-                border: 1px solid #555555;
-            }
-            QMenu::item:selected {
-                background-color: #555555;
-            }
-            QToolBar {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                color: #f0f0f0;
-            }
-            QStatusBar {
-                background-color: #3c3c3c;
-                color: #f0f0f0;
-                border-top: 1px solid #555555;
-            }
-            QSplitter::handle {
-                background-color: #555555;
-            }
-            QTableWidget {
-                background-color: #3c3c3c;
-                color: #f0f0f0;
-                gridline-color: #555555;
-            }
-            QTableWidget QHeaderView::section {
-                background-color: #404040;
-                color: white;
-                border: 1px solid #666666;
-                padding: 6px;
-                font-weight: bold;
-            }
-        """)
+        # Set once on the application so the sheet is parsed a single time
+        app = QApplication.instance()
+        if app.styleSheet() != DARK_STYLESHEET:
+            app.setStyleSheet(DARK_STYLESHEET)
 
 
 def main():
@@ -1,24 +1,171 @@
 """
 Configuration manager for loading and validating configuration files.
 """
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
 from pathlib import Path
+import copy
+import os
+import sys
 import yaml
 import json
 import logging
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+    logger.warning("libyaml is not available; configuration files will load several times slower")
+
+# Parsed configurations keyed by (path, mtime_ns, size, validated), so repeated
+# loads do not re-parse an unchanged file
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int, bool], Dict[str, Any]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+
+# Get default config path once (PyInstaller compatible)
+if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+    # Running in PyInstaller bundle
+    _DEFAULT_CONFIG_PATH = Path(sys._MEIPASS) / "src" / "config" / "default_config.yaml"
+else:
+    # Running in development
+    _DEFAULT_CONFIG_PATH = Path(__file__).parent / "default_config.yaml"
+
+# Upper bound on memoized get_value lookups per ConfigManager
+_VALUE_CACHE_SIZE = 256
+
+# Marks a key path that is missing from the configuration
+_MISSING = object()
+
+
+def _read_cached(file_path: Path, parse: Callable[[Path], Dict[str, Any]],
+                 validated: bool) -> Dict[str, Any]:
+    """
+    Return parse(file_path), reusing the in-process cache while the file is unchanged.
+    
+    Raises FileNotFoundError if the file does not exist. The result is a
+    private copy for the caller.
+    """
+    stat = file_path.stat()
+    key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, validated)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    config = parse(file_path)
+    
+    _CONFIG_CACHE[key] = copy.deepcopy(config)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return config
+
+
+def _parse_yaml(file_path: Path) -> Dict[str, Any]:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def read_yaml_cached(file_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML file without schema validation, through the in-process cache.
+    
+    Used by editors that must open files the schema would reject.
+    """
+    return _read_cached(file_path, _parse_yaml, validated=False)
+
 
 class ConfigurationError(Exception):
     """Custom exception for configuration errors."""
     pass
 
 
+class _ValidatingLoader(YamlLoader):
+    """
+    YAML loader that checks the node tree against ConfigManager._SCHEMA
+    before constructing Python objects, so YAML files need no second
+    validation pass and errors can point at source lines.
+    """
+    
+    def get_single_data(self) -> Any:
+        node = self.get_single_node()
+        errors: List[str] = []
+        if node is None:
+            errors.append("config: empty configuration")
+        else:
+            self._check_node(node, ConfigManager._SCHEMA, [], errors)
+        if errors:
+            raise ConfigurationError(f"Invalid configuration: {'; '.join(errors)}")
+        return self.construct_document(node)
+    
+    def _check_node(self, node: yaml.Node, schema: Dict[str, Any],
+                    path: List[str], errors: List[str]) -> None:
+        """Check node against the object/required/properties subset of JSON Schema."""
+        location = f"line {node.start_mark.line + 1}: {'.'.join(path) or 'config'}"
+        if not isinstance(node, yaml.MappingNode):
+            errors.append(f"{location}: expected a mapping")
+            return
+        
+        # Resolve merge keys so their fields count as present
+        self.flatten_mapping(node)
+        children = {
+            key_node.value: value_node
+            for key_node, value_node in node.value
+            if isinstance(key_node, yaml.ScalarNode)
+        }
+        
+        for field in schema.get('required', ()):
+            if field not in children:
+                errors.append(f"{location}: '{field}' is a required property")
+        
+        properties = schema.get('properties', {})
+        extra_schema = schema.get('additionalProperties')
+        for name, child in children.items():
+            child_schema = properties.get(name, extra_schema)
+            if isinstance(child_schema, dict) and child_schema.get('type') == 'object':
+                self._check_node(child, child_schema, path + [name], errors)
+
+
 class ConfigManager:
     """Manager for loading and validating configuration files."""
     
+    __slots__ = ('config_path', '_config_data', '_value_cache', '_config_version')
+    
+    # Structure every configuration must satisfy
+    _SCHEMA = {
+        'type': 'object',
+        'required': ['net_classification_rules', 'layout_rules', 'template_mapping'],
+        'properties': {
+            'net_classification_rules': {
+                'type': 'object',
+                'additionalProperties': {
+                    'type': 'object',
+                    'required': ['category', 'signal_type', 'priority']
+                }
+            },
+            'layout_rules': {
+                'type': 'object',
+                'additionalProperties': {
+                    'type': 'object',
+                    'required': ['impedance', 'description']
+                }
+            },
+            'template_mapping': {
+                'type': 'object',
+                'required': ['columns']
+            }
+        }
+    }
+    
+    # Compiled once and shared by all instances
+    _VALIDATOR = Draft7Validator(_SCHEMA)
+    
+    # Resolved once at import time; shared by all instances
+    default_config_path = _DEFAULT_CONFIG_PATH
+    
     def __init__(self, config_path: Optional[Path] = None):
         """
         Initialize configuration manager.
@@ -27,17 +174,27 @@ class ConfigManager:
             config_path: Path to configuration file (optional)
         """
         self.config_path = config_path
+        self._value_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._config_version = 0
         self.config_data = {}
         
-        # Get default config path (PyInstaller compatible)
-        import sys
-        if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-            # Running in PyInstaller bundle
-            self.default_config_path = Path(sys._MEIPASS) / "src" / "config" / "default_config.yaml"
-        else:
-            # Running in development
-            self.default_config_path = Path(__file__).parent / "default_config.yaml"
-        
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """Currently loaded configuration."""
+        return self._config_data
+    
+    @config_data.setter
+    def config_data(self, value: Dict[str, Any]) -> None:
+        self._config_data = value
+        self._value_cache.clear()
+        self._config_version += 1
+    
+    @property
+    def config_version(self) -> int:
+        """Counter bumped whenever the configuration is replaced or updated,
+        so consumers can tell when rules they derived from it are stale."""
+        return self._config_version
+    
     def load_config(self, config_path: Optional[Path] = None) -> Dict[str, Any]:
         """
         Load configuration from file.
@@ -57,22 +214,56 @@ class ConfigManager:
         # Try to load user config first, fallback to default
         try:
             if self.config_path and self.config_path.exists():
-                self.config_data = self._load_file(self.config_path)
+                self.config_data = self._load_cached(self.config_path)
                 logger.info(f"Loaded configuration from: {self.config_path}")
             else:
-                self.config_data = self._load_file(self.default_config_path)
+                self.config_data = self._load_cached(self.default_config_path)
                 logger.info("Loaded default configuration")
                 
-            # Validate configuration
-            self._validate_config(self.config_data)
             return self.config_data
             
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {str(e)}")
     
+    def _load_cached(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Load and validate a configuration file, reusing a cached parse when
+        the file is unchanged.
+        
+        Args:
+            file_path: Path to configuration file
+            
+        Returns:
+            Configuration dictionary (a private copy for this instance)
+        """
+        try:
+            return _read_cached(file_path, self._load_file, validated=True)
+        except FileNotFoundError:
+            raise ConfigurationError(f"Configuration file not found: {file_path}")
+    
+    def invalidate_cache(self, config_path: Optional[Path] = None) -> None:
+        """
+        Drop cached parses of a configuration file.
+        
+        Args:
+            config_path: File to invalidate; defaults to the current config path.
+                The whole cache is cleared if neither is set.
+        """
+        target = config_path or self.config_path
+        if target is None:
+            _CONFIG_CACHE.clear()
+            return
+        
+        resolved = str(Path(target).resolve())
+        for key in [key for key in _CONFIG_CACHE if key[0] == resolved]:
+            del _CONFIG_CACHE[key]
+    
     def _load_file(self, file_path: Path) -> Dict[str, Any]:
         """
-        Load configuration from YAML or JSON file.
+        Load and validate configuration from YAML or JSON file.
+        
+        YAML files are validated on the node tree while parsing; JSON files
+        are validated after loading.
         
         Args:
             file_path: Path to configuration file
@@ -83,9 +274,15 @@ class ConfigManager:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    return yaml.safe_load(f)
+                    loader = _ValidatingLoader(f.read())
+                    try:
+                        return loader.get_single_data()
+                    finally:
+                        loader.dispose()
                 elif file_path.suffix.lower() == '.json':
-                    return json.load(f)
+                    config = json.load(f)
+                    self._validate_config(config)
+                    return config
                 else:
                     raise ConfigurationError(f"Unsupported config file format: {file_path.suffix}")
                     
@@ -106,51 +303,14 @@ class ConfigManager:
         Raises:
             ConfigurationError: If validation fails
         """
-        required_sections = [
-            'net_classification_rules',
-            'layout_rules',
-            'template_mapping'
-        ]
-        
-        for section in required_sections:
-            if section not in config:
-                raise ConfigurationError(f"Missing required configuration section: {section}")
-        
-        # Validate net classification rules
-        self._validate_classification_rules(config['net_classification_rules'])
-        
-        # Validate layout rules
-        self._validate_layout_rules(config['layout_rules'])
-        
-        # Validate template mapping
-        self._validate_template_mapping(config['template_mapping'])
-    
-    def _validate_classification_rules(self, rules: Dict[str, Any]) -> None:
-        """Validate net classification rules structure."""
-        required_fields = ['category', 'signal_type', 'priority']
-        
-        for rule_name, rule_config in rules.items():
-            for field in required_fields:
-                if field not in rule_config:
-                    raise ConfigurationError(
-                        f"Missing required field '{field}' in classification rule '{rule_name}'"
-                    )
-    
-    def _validate_layout_rules(self, rules: Dict[str, Any]) -> None:
-        """Validate layout rules structure."""
-        required_fields = ['impedance', 'description']
-        
-        for rule_name, rule_config in rules.items():
-            for field in required_fields:
-                if field not in rule_config:
-                    raise ConfigurationError(
-                        f"Missing required field '{field}' in layout rule '{rule_name}'"
-                    )
-    
-    def _validate_template_mapping(self, mapping: Dict[str, Any]) -> None:
-        """Validate template mapping structure."""
-        if 'columns' not in mapping:
-            raise ConfigurationError("Missing 'columns' section in template_mapping")
+        errors = sorted(self._VALIDATOR.iter_errors(config),
+                        key=lambda error: [str(part) for part in error.absolute_path])
+        if errors:
+            messages = [
+                f"{'.'.join(str(part) for part in error.absolute_path) or 'config'}: {error.message}"
+                for error in errors
+            ]
+            raise ConfigurationError(f"Invalid configuration: {'; '.join(messages)}")
     
     def get_section(self, section_name: str) -> Dict[str, Any]:
         """
@@ -188,16 +348,22 @@ class ConfigManager:
         """
         if not self.config_data:
             self.load_config()
-            
-        keys = key_path.split('.')
-        value = self.config_data
         
         try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default_value
+            value = self._value_cache[key_path]
+        except KeyError:
+            value = self.config_data
+            try:
+                for key in key_path.split('.'):
+                    value = value[key]
+            except (KeyError, TypeError):
+                value = _MISSING
+            
+            self._value_cache[key_path] = value
+            if len(self._value_cache) > _VALUE_CACHE_SIZE:
+                self._value_cache.popitem(last=False)
+        
+        return default_value if value is _MISSING else value
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """
@@ -210,6 +376,8 @@ class ConfigManager:
             self.load_config()
             
         self._deep_update(self.config_data, updates)
+        self._value_cache.clear()
+        self._config_version += 1
         self._validate_config(self.config_data)
     
     def _deep_update(self, base_dict: Dict[str, Any], update_dict: Dict[str, Any]) -> None:
@@ -220,11 +388,15 @@ class ConfigManager:
             base_dict: Base dictionary to update
             update_dict: Updates to apply
         """
-        for key, value in update_dict.items():
-            if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        stack = [(base_dict, update_dict)]
+        while stack:
+            base, updates = stack.pop()
+            for key, value in updates.items():
+                base_value = base.get(key)
+                if isinstance(base_value, dict) and isinstance(value, dict):
+                    stack.append((base_value, value))
+                else:
+                    base[key] = value
     
     def save_config(self, output_path: Optional[Path] = None) -> None:
         """
@@ -236,15 +408,22 @@ class ConfigManager:
         if not self.config_data:
             raise ConfigurationError("No configuration data to save")
             
-        save_path = output_path or self.config_path or Path("config.yaml")
+        save_path = Path(output_path or self.config_path or "config.yaml")
+        tmp_path = save_path.with_name(save_path.name + '.tmp')
         
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False, 
-                         allow_unicode=True, indent=2)
+            self.invalidate_cache(save_path)
+            data = yaml.dump(self.config_data, Dumper=YamlDumper, default_flow_style=False,
+                             allow_unicode=True, indent=2).encode('utf-8')
+            
+            # Write a sibling file and swap it in so a failed save never
+            # leaves a truncated configuration behind
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, save_path)
             logger.info(f"Configuration saved to: {save_path}")
             
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             raise ConfigurationError(f"Failed to save configuration: {str(e)}")
     
     def create_user_config_template(self, output_path: Path) -> None:
@@ -282,7 +461,7 @@ class ConfigManager:
         
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(template_config, f, default_flow_style=False,
+                yaml.dump(template_config, f, Dumper=YamlDumper, default_flow_style=False,
                          allow_unicode=True, indent=2)
             logger.info(f"User config template created at: {output_path}")
             
@@ -299,9 +478,10 @@ class ConfigManager:
         if not self.config_data:
             self.load_config()
             
+        config = self.config_data
         return {
-            'classification_rules': list(self.config_data.get('net_classification_rules', {}).keys()),
-            'layout_rules': list(self.config_data.get('layout_rules', {}).keys())
+            'classification_rules': list(config.get('net_classification_rules', {})),
+            'layout_rules': list(config.get('layout_rules', {}))
         }
     
     def export_config_summary(self) -> Dict[str, Any]:
@@ -314,11 +494,12 @@ class ConfigManager:
         if not self.config_data:
             self.load_config()
             
+        config = self.config_data
         return {
-            'app_info': self.config_data.get('app_info', {}),
-            'total_classification_rules': len(self.config_data.get('net_classification_rules', {})),
-            'total_layout_rules': len(self.config_data.get('layout_rules', {})),
-            'supported_formats': self.config_data.get('netlist_parser', {}).get('supported_formats', []),
-            'template_columns': list(self.config_data.get('template_mapping', {}).get('columns', {}).keys()),
+            'app_info': config.get('app_info', {}),
+            'total_classification_rules': len(config.get('net_classification_rules', {})),
+            'total_layout_rules': len(config.get('layout_rules', {})),
+            'supported_formats': config.get('netlist_parser', {}).get('supported_formats', []),
+            'template_columns': list(config.get('template_mapping', {}).get('columns', {})),
             'config_source': str(self.config_path) if self.config_path else 'default'
         }
@@ -1,16 +1,36 @@
 """
 Controllers package for the advanced impedance control GUI
 進階阻抗控制GUI的控制器套件
+
+Controllers are imported on first attribute access (PEP 562), so importing
+one controller module does not pull in the others.
 """
 
-from .configuration_controller import ConfigurationController
-from .signal_rule_controller import SignalRuleController
-from .layout_rule_controller import LayoutRuleController
-from .template_mapping_controller import TemplateMappingController
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'ConfigurationController': 'configuration_controller',
+    'SignalRuleController': 'signal_rule_controller',
+    'LayoutRuleController': 'layout_rule_controller',
+    'TemplateMappingController': 'template_mapping_controller'
+}
 
 __all__ = [
     'ConfigurationController',
     'SignalRuleController',
-    'LayoutRuleController', 
+    'LayoutRuleController',
     'TemplateMappingController'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,18 +3,64 @@ Configuration Controller for managing overall configuration operations
 配置控制器，用於管理整體配置操作
 """
 
+import hashlib
 import json
+import pickle
+import zlib
+from collections import Counter, deque
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtWidgets import QMessageBox, QFileDialog
+from typing import Deque, Dict, Any, Optional
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it encodes straight to UTF-8 bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.configuration_model import ConfigurationModel
 
 
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when available
+    
+    Values JSON cannot represent natively (e.g. Path) are written as str().
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _pack_state(state: Dict[str, Any]) -> bytes:
+    """Serialize and compress a configuration snapshot for the undo/redo stacks"""
+    return zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL), 1)
+
+
+def _unpack_state(blob: bytes) -> Dict[str, Any]:
+    """Restore a configuration snapshot packed by _pack_state"""
+    return pickle.loads(zlib.decompress(blob))
+
+
+class ConfigLoadThread(QThread):
+    """Background thread for reading configuration files"""
+    loaded = pyqtSignal(dict, str)  # config data, config file path
+    failed = pyqtSignal(str)        # error message
+    
+    def __init__(self, config_path: Path):
+        super().__init__()
+        self.config_path = config_path
+    
+    def run(self):
+        try:
+            config_data = ConfigurationModel.read_config_file(self.config_path)
+            self.loaded.emit(config_data, str(self.config_path))
+        except Exception as e:
+            self.failed.emit(f"載入配置檔案時發生錯誤: {str(e)}")
+
+
 class ConfigurationController(QObject):
     """
     Main controller for managing configuration operations
@@ -27,14 +73,26 @@ class ConfigurationController(QObject):
     errorOccurred = pyqtSignal(str)     # error message
     validationCompleted = pyqtSignal(bool, list)  # success, error list
     operationProgress = pyqtSignal(str)  # progress message
+    busyChanged = pyqtSignal(bool)       # background operation running
     
     def __init__(self, config_model: ConfigurationModel):
         super().__init__()
         self.config_model = config_model
         self.is_modified = False
-        self.undo_stack: List[Dict[str, Any]] = []
-        self.redo_stack: List[Dict[str, Any]] = []
         self.max_undo_levels = 50
+        # The stacks hold snapshot digests; the oldest fall off the left end
+        self.undo_stack: Deque[bytes] = deque(maxlen=self.max_undo_levels)
+        self.redo_stack: Deque[bytes] = deque(maxlen=self.max_undo_levels)
+        # Packed snapshots (see _pack_state) by digest, shared by identical states
+        self._snapshots: Dict[bytes, bytes] = {}
+        self._snapshot_refs: Counter = Counter()
+        self.load_thread: Optional[ConfigLoadThread] = None
+        
+        # Coalesce bursts of model changes into one snapshot per 150 ms
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(150)
+        self._snapshot_timer.timeout.connect(self._save_state_for_undo)
         
         # Connect to model signals
         self.config_model.dataChanged.connect(self._on_model_changed)
@@ -45,13 +103,13 @@ class ConfigurationController(QObject):
     def _on_model_changed(self):
         """Handle model data changes"""
         self.is_modified = True
-        self._save_state_for_undo()
+        self._snapshot_timer.start()
     
     def _on_config_loaded(self, config_path: str):
         """Handle successful config loading"""
         self.is_modified = False
-        self.undo_stack.clear()
-        self.redo_stack.clear()
+        self._snapshot_timer.stop()
+        self._clear_history()
         self.configLoaded.emit(config_path)
         self.operationProgress.emit(f"配置已載入: {config_path}")
     
@@ -65,22 +123,73 @@ class ConfigurationController(QObject):
         """Handle validation errors from model"""
         self.errorOccurred.emit(error_message)
     
+    def _current_state(self) -> bytes:
+        """Return the packed current state
+        
+        Always rebuilt from the model: rule-level edits (e.g. SignalRuleModel.set_category)
+        emit only the rule's own signal, so a state cached on dataChanged could be stale.
+        """
+        return _pack_state(self.config_model._build_config_data())
+    
+    def _push_state(self, stack: Deque[bytes], packed_state: bytes):
+        """Push a packed snapshot onto stack, storing its payload once per digest"""
+        digest = hashlib.blake2b(packed_state, digest_size=16).digest()
+        if len(stack) == stack.maxlen:
+            self._release_state(stack[0])
+        stack.append(digest)
+        self._snapshots.setdefault(digest, packed_state)
+        self._snapshot_refs[digest] += 1
+    
+    def _pop_state(self, stack: Deque[bytes]) -> bytes:
+        """Pop the newest snapshot off stack and return its packed payload"""
+        digest = stack.pop()
+        packed_state = self._snapshots[digest]
+        self._release_state(digest)
+        return packed_state
+    
+    def _release_state(self, digest: bytes):
+        """Drop one reference to a snapshot, freeing its payload when unused"""
+        self._snapshot_refs[digest] -= 1
+        if self._snapshot_refs[digest] <= 0:
+            del self._snapshot_refs[digest]
+            del self._snapshots[digest]
+    
+    def _clear_redo_stack(self):
+        """Discard all redo snapshots"""
+        for digest in self.redo_stack:
+            self._release_state(digest)
+        self.redo_stack.clear()
+    
+    def _clear_history(self):
+        """Discard all undo and redo snapshots"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self._snapshots.clear()
+        self._snapshot_refs.clear()
+    
     def _save_state_for_undo(self):
         """Save current state for undo functionality"""
         try:
-            current_state = self.config_model._build_config_data()
-            self.undo_stack.append(current_state)
+            current_state = self._current_state()
             
-            # Limit undo stack size
-            if len(self.undo_stack) > self.max_undo_levels:
-                self.undo_stack.pop(0)
+            # Skip snapshots identical to the most recent one
+            if self.undo_stack and self._snapshots[self.undo_stack[-1]] == current_state:
+                return
+            
+            self._push_state(self.undo_stack, current_state)
             
             # Clear redo stack when new action is performed
-            self.redo_stack.clear()
+            self._clear_redo_stack()
             
         except Exception as e:
             logger.warning(f"Could not save state for undo: {e}")
     
+    def _flush_pending_snapshot(self):
+        """Save a snapshot still waiting on the debounce timer"""
+        if self._snapshot_timer.isActive():
+            self._snapshot_timer.stop()
+            self._save_state_for_undo()
+    
     def load_config_file(self, config_path: Optional[Path] = None) -> bool:
         """
         Load configuration from file with user dialog if path not provided
@@ -88,11 +197,14 @@ class ConfigurationController(QObject):
         """
         try:
             if config_path is None:
+                from PyQt5.QtWidgets import QFileDialog
+                from widgets.file_dialog import FILE_DIALOG_OPTIONS
                 file_path, _ = QFileDialog.getOpenFileName(
                     None,
                     "載入配置檔案",
                     str(Path.home()),
-                    "YAML Files (*.yaml *.yml);;JSON Files (*.json);;All Files (*)"
+                    "YAML Files (*.yaml *.yml);;JSON Files (*.json);;All Files (*)",
+                    options=FILE_DIALOG_OPTIONS
                 )
                 if not file_path:
                     return False
@@ -111,6 +223,49 @@ class ConfigurationController(QObject):
             self.errorOccurred.emit(error_msg)
             return False
     
+    def load_config_file_async(self, config_path: Optional[Path] = None) -> bool:
+        """
+        Load configuration on a background thread, asking for a path if not provided
+        在背景執行緒載入配置檔案，如果未提供路徑則顯示使用者對話框
+        
+        The model is updated on the GUI thread once the file has been read.
+        """
+        if self.load_thread is not None and self.load_thread.isRunning():
+            return False
+        
+        if config_path is None:
+            from PyQt5.QtWidgets import QFileDialog
+            from widgets.file_dialog import FILE_DIALOG_OPTIONS
+            file_path, _ = QFileDialog.getOpenFileName(
+                None,
+                "載入配置檔案",
+                str(Path.home()),
+                "YAML Files (*.yaml *.yml);;JSON Files (*.json);;All Files (*)",
+                options=FILE_DIALOG_OPTIONS
+            )
+            if not file_path:
+                return False
+            config_path = Path(file_path)
+        
+        self.operationProgress.emit(f"正在載入配置: {config_path}")
+        self.busyChanged.emit(True)
+        
+        self.load_thread = ConfigLoadThread(Path(config_path))
+        self.load_thread.loaded.connect(self._on_config_data_loaded)
+        self.load_thread.failed.connect(self._on_config_load_failed)
+        self.load_thread.finished.connect(lambda: self.busyChanged.emit(False))
+        self.load_thread.start()
+        return True
+    
+    def _on_config_data_loaded(self, config_data: Dict[str, Any], config_path: str):
+        """Apply configuration data read by the load thread"""
+        if self.config_model.apply_config_data(config_data, Path(config_path)):
+            self.operationProgress.emit("配置載入成功")
+    
+    def _on_config_load_failed(self, error_message: str):
+        """Handle load thread failure"""
+        self.errorOccurred.emit(error_message)
+    
     def save_config_file(self, config_path: Optional[Path] = None) -> bool:
         """
         Save configuration to file with user dialog if path not provided
@@ -144,11 +299,14 @@ class ConfigurationController(QObject):
         使用對話框另存新檔
         """
         try:
+            from PyQt5.QtWidgets import QFileDialog
+            from widgets.file_dialog import FILE_DIALOG_OPTIONS
             file_path, _ = QFileDialog.getSaveFileName(
                 None,
                 "另存配置檔案",
                 str(Path.home() / "impedance_config.yaml"),
-                "YAML Files (*.yaml *.yml);;JSON Files (*.json);;All Files (*)"
+                "YAML Files (*.yaml *.yml);;JSON Files (*.json);;All Files (*)",
+                options=FILE_DIALOG_OPTIONS
             )
             
             if not file_path:
@@ -214,6 +372,7 @@ class ConfigurationController(QObject):
         """
         try:
             if self.is_modified:
+                from PyQt5.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     None, "創建新配置",
                     "目前配置尚未儲存，是否要先儲存？",
@@ -235,8 +394,8 @@ class ConfigurationController(QObject):
             self.config_model.config_file_path = None
             
             self.is_modified = False
-            self.undo_stack.clear()
-            self.redo_stack.clear()
+            self._snapshot_timer.stop()
+            self._clear_history()
             
             self.config_model.dataChanged.emit()
             self.operationProgress.emit("新配置已創建")
@@ -250,17 +409,17 @@ class ConfigurationController(QObject):
     
     def undo(self) -> bool:
         """Undo last action"""
+        self._flush_pending_snapshot()
         if not self.undo_stack:
             return False
         
         try:
             # Save current state to redo stack
-            current_state = self.config_model._build_config_data()
-            self.redo_stack.append(current_state)
+            self._push_state(self.redo_stack, self._current_state())
             
             # Restore previous state
-            previous_state = self.undo_stack.pop()
-            self.config_model._parse_config_data(previous_state)
+            packed_state = self._pop_state(self.undo_stack)
+            self.config_model._parse_config_data(_unpack_state(packed_state))
             
             self.operationProgress.emit("已復原上一步操作")
             return True
@@ -272,17 +431,17 @@ class ConfigurationController(QObject):
     
     def redo(self) -> bool:
         """Redo last undone action"""
+        self._flush_pending_snapshot()
         if not self.redo_stack:
             return False
         
         try:
             # Save current state to undo stack
-            current_state = self.config_model._build_config_data()
-            self.undo_stack.append(current_state)
+            self._push_state(self.undo_stack, self._current_state())
             
             # Restore next state
-            next_state = self.redo_stack.pop()
-            self.config_model._parse_config_data(next_state)
+            packed_state = self._pop_state(self.redo_stack)
+            self.config_model._parse_config_data(_unpack_state(packed_state))
             
             self.operationProgress.emit("已重做上一步操作")
             return True
@@ -294,7 +453,7 @@ class ConfigurationController(QObject):
     
     def can_undo(self) -> bool:
         """Check if undo is available"""
-        return len(self.undo_stack) > 0
+        return len(self.undo_stack) > 0 or self._snapshot_timer.isActive()
     
     def can_redo(self) -> bool:
         """Check if redo is available"""
@@ -324,8 +483,7 @@ class ConfigurationController(QObject):
             }
             summary['template_summary'] = self.config_model.template_mapping.get_summary()
             
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump(summary, file, indent=2, ensure_ascii=False)
+            Path(output_path).write_bytes(_dump_json(summary))
             
             self.operationProgress.emit(f"配置摘要已匯出: {output_path}")
             return True
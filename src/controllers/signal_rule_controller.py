@@ -73,7 +73,7 @@ class SignalRuleController(QObject):
             return []
         
         rule = self.signal_rules[rule_name]
-        matched_nets = [net for net in net_list if rule.matches_net(net)]
+        matched_nets = list(filter(rule.compile_matcher(), net_list))
         
         self.testCompleted.emit(rule_name, matched_nets)
         return matched_nets
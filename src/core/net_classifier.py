@@ -1,17 +1,105 @@
 """Net classifier module for categorizing network names based on patterns and rules."""
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, FrozenSet, Iterable, Mapping, Optional, Pattern, Tuple
 import re
 import logging
 from config.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Upper-cased keywords, compiled patterns and upper-cased exact matches of a rule
+CompiledRule = Tuple[Tuple[str, ...], Tuple[Pattern, ...], FrozenSet[str]]
+
+# Patterns such as '.*CLOCK.*' that only test for a literal substring
+_LITERAL_PATTERN = re.compile(r'(?:\^?\.\*)?(?P<literal>[A-Za-z0-9_]+)(?:\.\*\$?)?')
+
+# Backreferences and named groups depend on group numbering within their own pattern
+_UNFUSABLE_PATTERN = re.compile(r'\\[1-9]|\(\?P[<=]')
+
+# Upper bound on remembered net-name -> matched-rule lookups per classifier
+_MATCH_CACHE_SIZE = 100_000
+
+
+def fuse_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+    """
+    Compile regex sources into one case-insensitive alternation.
+    
+    Args:
+        patterns: Valid regex sources
+        
+    Returns:
+        The fused regex, or None if the patterns cannot share one regex
+        (back-references, named groups, inline global flags)
+    """
+    patterns = list(patterns)
+    if any(_UNFUSABLE_PATTERN.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+    except re.error:
+        return None  # e.g. inline global flags, which are only valid at the start of a regex
+
 
 class NetClassificationError(Exception):
     """Custom exception for net classification errors."""
     pass
 
 
+@dataclass(frozen=True)
+class Classification:
+    """Classification details of a net.
+
+    Instances are immutable, so every net matched by the same rule shares one.
+    Item access (``result['category']``, ``result.get('priority')``) is kept
+    for callers written against the former dict results.
+    """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('category', 'signal_type', 'rule_matched', 'priority')
+
+    category: str
+    signal_type: str
+    rule_matched: str
+    priority: int
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _CLASSIFICATION_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in _CLASSIFICATION_FIELDS:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the classification as a plain dict, e.g. for serialization."""
+        return {name: getattr(self, name) for name in _CLASSIFICATION_FIELDS}
+
+    # Pickle support; frozen instances cannot use the default slot setattr path
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Classification':
+        """Build a classification from a (possibly partial) dict, defaulting missing keys."""
+        return cls(
+            category=data.get('category', _DEFAULT_CLASSIFICATION.category),
+            signal_type=data.get('signal_type', _DEFAULT_CLASSIFICATION.signal_type),
+            rule_matched=data.get('rule_matched', _DEFAULT_CLASSIFICATION.rule_matched),
+            priority=data.get('priority', _DEFAULT_CLASSIFICATION.priority)
+        )
+
+
+_CLASSIFICATION_FIELDS = tuple(field.name for field in fields(Classification))
+
+# Result for nets that match no rule
+_DEFAULT_CLASSIFICATION = Classification('Other', 'Single-End', 'default', 999)
+
+
 class NetClassifier:
     """Classifier for categorizing network names based on predefined rules."""
 
@@ -22,9 +110,26 @@ class NetClassifier:
             config_manager: Configuration manager providing classification rules.
         """
         self.config_manager = config_manager or ConfigManager()
+        self._load_rules()
+    
+    def _load_rules(self) -> None:
+        """(Re)build the rules and everything derived from them from the config manager."""
         self.classification_rules = self.config_manager.get_classification_rules()
+        # Rules can change through the manager (update_config, config_data); the
+        # derived state below is rebuilt by classify() when its version moves on
+        self._rules_version = self.config_manager.config_version
+        self._compiled_rules = {
+            rule_name: self._compile_rule(rule_config)
+            for rule_name, rule_config in self.classification_rules.items()
+        }
+        self._rule_results = {
+            rule_name: self._make_classification(rule_name, rule_config)
+            for rule_name, rule_config in self.classification_rules.items()
+        }
+        # Net name -> classification of the first matching rule
+        self._match_cache: Dict[str, Classification] = {}
     
-    def classify(self, net_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    def classify(self, net_names: List[str]) -> Dict[str, Classification]:
         """
         Classify a list of net names according to predefined rules.
         
@@ -34,16 +139,16 @@ class NetClassifier:
         Returns:
             Dictionary mapping net names to their classification details
         """
-        results = {}
+        if self.config_manager.config_version != self._rules_version:
+            self._load_rules()
         
-        for net_name in net_names:
-            classification = self._classify_single_net(net_name)
-            results[net_name] = classification
+        classify_net = self._classify_single_net
+        results = {net_name: classify_net(net_name) for net_name in net_names}
         
         logger.info(f"Classified {len(net_names)} nets")
         return results
     
-    def _classify_single_net(self, net_name: str) -> Dict[str, Any]:
+    def _classify_single_net(self, net_name: str) -> Classification:
         """
         Classify a single net name.
         
@@ -53,57 +158,132 @@ class NetClassifier:
         Returns:
             Classification details including category, signal_type, etc.
         """
-        # Try each classification rule
+        try:
+            return self._match_cache[net_name]
+        except KeyError:
+            pass
+        
+        rule_name = self._find_matching_rule(net_name)
+        if rule_name is not None:
+            result = self._rule_results.get(rule_name)
+            if result is None:
+                # Rule added to the config after this classifier was built
+                result = self._make_classification(
+                    rule_name, self.classification_rules[rule_name])
+                self._rule_results[rule_name] = result
+        else:
+            # Default classification if no rules match
+            result = _DEFAULT_CLASSIFICATION
+        
+        if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._match_cache[next(iter(self._match_cache))]
+        self._match_cache[net_name] = result
+        return result
+    
+    @staticmethod
+    def _make_classification(rule_name: str, rule_config: Dict[str, Any]) -> Classification:
+        """Build the classification shared by all nets matching a rule."""
+        return Classification(
+            category=rule_config.get('category', 'Unknown'),
+            signal_type=rule_config.get('signal_type', 'Single-End'),
+            rule_matched=rule_name,
+            priority=rule_config.get('priority', 100)
+        )
+    
+    def _find_matching_rule(self, net_name: str) -> Optional[str]:
+        """
+        Find the first rule, in configuration order, that matches a net name.
+        
+        Args:
+            net_name: Name of the net to match
+            
+        Returns:
+            Name of the matching rule, or None if no rule matches
+        """
+        net_upper = net_name.upper()
         for rule_name, rule_config in self.classification_rules.items():
-            if self._matches_rule(net_name, rule_config):
-                return {
-                    'category': rule_config.get('category', 'Unknown'),
-                    'signal_type': rule_config.get('signal_type', 'Single-End'),
-                    'rule_matched': rule_name,
-                    'priority': rule_config.get('priority', 100)
-                }
-        
-        # Default classification if no rules match
-        return {
-            'category': 'Other',
-            'signal_type': 'Single-End', 
-            'rule_matched': 'default',
-            'priority': 999
-        }
+            if self._matches_rule(net_name, rule_config, self._compiled_rules.get(rule_name), net_upper):
+                return rule_name
+        return None
     
-    def _matches_rule(self, net_name: str, rule_config: Dict[str, Any]) -> bool:
+    def _matches_rule(self, net_name: str, rule_config: Dict[str, Any],
+                      compiled_rule: Optional[CompiledRule] = None,
+                      net_upper: Optional[str] = None) -> bool:
         """
         Check if a net name matches a specific rule.
         
         Args:
             net_name: Name to check
             rule_config: Rule configuration dictionary
+            compiled_rule: Precompiled form of the rule from ``_compile_rule``
+            net_upper: ``net_name.upper()``, if the caller already computed it
             
         Returns:
             True if net name matches the rule
         """
+        if compiled_rule is None:
+            compiled_rule = self._compile_rule(rule_config)
+        keywords, patterns, exact_matches = compiled_rule
+        if net_upper is None:
+            net_upper = net_name.upper()
+        
         # Check keyword matching
-        keywords = rule_config.get('keywords', [])
         for keyword in keywords:
-            if keyword.upper() in net_name.upper():
+            if keyword in net_upper:
                 return True
         
         # Check regex pattern matching
-        patterns = rule_config.get('patterns', [])
         for pattern in patterns:
+            if pattern.search(net_name):
+                return True
+        
+        # Check exact matching with a single hash lookup
+        return net_upper in exact_matches
+    
+    @staticmethod
+    def _compile_rule(rule_config: Dict[str, Any]) -> CompiledRule:
+        """
+        Compile a rule once into the form used by ``_matches_rule``.
+        
+        Patterns that only test for a literal substring are folded into the
+        keyword check, and the remaining patterns are fused into a single
+        case-insensitive alternation where possible.
+        
+        Args:
+            rule_config: Rule configuration dictionary
+            
+        Returns:
+            Upper-cased keywords, compiled patterns and upper-cased exact matches
+        """
+        keywords = [keyword.upper() for keyword in rule_config.get('keywords', [])]
+        patterns = []
+        for pattern in rule_config.get('patterns', []):
             try:
-                if re.search(pattern, net_name, re.IGNORECASE):
-                    return True
+                compiled = re.compile(pattern, re.IGNORECASE)
             except re.error as e:
                 logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+                continue
+            
+            literal = _LITERAL_PATTERN.fullmatch(pattern)
+            if literal:
+                keywords.append(literal.group('literal').upper())
+            else:
+                patterns.append((pattern, compiled))
         
-        # Check exact matching
-        exact_matches = rule_config.get('exact_matches', [])
-        for exact in exact_matches:
-            if net_name.upper() == exact.upper():
-                return True
+        compiled_patterns = tuple(compiled for _, compiled in patterns)
+        fusable = [pattern for pattern, _ in patterns if not _UNFUSABLE_PATTERN.search(pattern)]
+        fused = fuse_patterns(fusable) if len(fusable) > 1 else None
+        if fused is not None:
+            compiled_patterns = (fused,) + tuple(
+                compiled for pattern, compiled in patterns if _UNFUSABLE_PATTERN.search(pattern)
+            )
         
-        return False
+        return (
+            tuple(dict.fromkeys(keywords)),
+            compiled_patterns,
+            frozenset(exact.upper() for exact in rule_config.get('exact_matches', []))
+        )
     
     def add_custom_rule(self, rule_name: str, rule_config: Dict[str, Any]) -> None:
         """
@@ -119,13 +299,16 @@ class NetClassifier:
                 raise NetClassificationError(f"Missing required field '{field}' in rule config")
         
         self.classification_rules[rule_name] = rule_config
+        self._compiled_rules[rule_name] = self._compile_rule(rule_config)
+        self._rule_results[rule_name] = self._make_classification(rule_name, rule_config)
+        self._match_cache.clear()
         logger.info(f"Added custom rule: {rule_name}")
     
-    def get_classification_summary(self, classified_nets: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    def get_classification_summary(self, classified_nets: Dict[str, Classification]) -> Dict[str, int]:
         """Get summary statistics of classification results."""
         summary = {}
         for net_data in classified_nets.values():
-            category = net_data['category']
+            category = net_data.category
             summary[category] = summary.get(category, 0) + 1
 
         return summary
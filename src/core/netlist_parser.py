@@ -1,13 +1,21 @@
 """
 Netlist parser module for extracting net names from various netlist formats.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from pathlib import Path
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Component references (R123, C45), pure numbers and values (10ohm, 22f, 1h),
+# fused into one alternation and compiled once at import time.
+_EXCLUDED_RE = re.compile(r'(?:[a-zA-Z][0-9]+|[0-9]+|[0-9]+(?:ohm|f|h))', re.IGNORECASE)
+
+
+# Large read buffer so big netlists are read in few system calls
+_READ_BUFFER_SIZE = 1 << 20
+
 
 class NetlistParseError(Exception):
     """Custom exception for netlist parsing errors."""
@@ -26,11 +34,6 @@ class NetlistParser:
         """
         self.config = config or {}
         self.supported_formats = ['.net', '.sp', '.cir', '.txt']
-        self.excluded_patterns = [
-            r'^[a-zA-Z][0-9]+$',  # Component references like R123, C45
-            r'^[0-9]+$',          # Pure numbers
-            r'^[0-9]+(ohm|f|h)$'  # Values like 10ohm, 22f, 1h
-        ]
     
     def parse(self, netlist_path: Path) -> List[str]:
         """
@@ -53,14 +56,13 @@ class NetlistParser:
             if file_extension not in self.supported_formats:
                 logger.warning(f"Unsupported format {file_extension}, attempting generic parsing")
             
-            with open(netlist_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            net_names = self._extract_net_names(content)
-            filtered_names = self._filter_excluded_names(net_names)
+            # Iterate the file object directly so only one line is held at a time,
+            # collecting straight into a set; excluded words are dropped during extraction
+            with open(netlist_path, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as f:
+                net_names = set(self._iter_net_names(f))
             
-            logger.info(f"Extracted {len(filtered_names)} net names from {netlist_path}")
-            return sorted(list(set(filtered_names)))  # Remove duplicates and sort
+            logger.info(f"Extracted {len(net_names)} unique net names from {netlist_path}")
+            return sorted(net_names)
             
         except Exception as e:
             raise NetlistParseError(f"Failed to parse netlist {netlist_path}: {str(e)}")
@@ -75,39 +77,44 @@ class NetlistParser:
         Returns:
             List of potential net names
         """
-        net_names = []
+        return self._extract_from_lines(content.splitlines())
+    
+    def _extract_from_lines(self, lines: Iterable[str]) -> List[str]:
+        """
+        Extract net names from an iterable of netlist lines.
         
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith('*') or line.startswith('#'):
-                continue  # Skip empty lines and comments
+        Args:
+            lines: Netlist lines, e.g. an open file object
             
-            # Check if line starts with a number (typical netlist format)
-            if line and line[0].isdigit():
-                parts = line.split()
-                if len(parts) > 1:
-                    # Second element is typically the net name
-                    potential_net = parts[1]
-                    if potential_net and not self._is_excluded_word(potential_net):
-                        net_names.append(potential_net)
-        
-        return net_names
+        Returns:
+            List of potential net names
+        """
+        return list(self._iter_net_names(lines))
     
-    def _filter_excluded_names(self, names: List[str]) -> List[str]:
+    def _iter_net_names(self, lines: Iterable[str]) -> Iterator[str]:
         """
-        Filter out component references and other excluded patterns.
+        Yield potential net names from netlist lines, in file order.
         
         Args:
-            names: List of potential net names
+            lines: Netlist lines, e.g. an open file object
             
-        Returns:
-            Filtered list of net names
+        Yields:
+            Net names that are not excluded words
         """
-        filtered = []
-        for name in names:
-            if not self._is_excluded_word(name):
-                filtered.append(name)
-        return filtered
+        for line in lines:
+            line = line.lstrip()
+            if not line or line[0] in '*#':
+                continue  # Skip empty lines and comments
+            
+            # Check if line starts with a number (typical netlist format)
+            if line[0].isdigit():
+                # Only the first two fields are needed
+                parts = line.split(None, 2)
+                if len(parts) > 1:
+                    # Second element is typically the net name
+                    potential_net = parts[1]
+                    if potential_net and not self._is_excluded_word(potential_net):
+                        yield potential_net
     
     def _is_excluded_word(self, word: str) -> bool:
         """
@@ -119,9 +126,17 @@ class NetlistParser:
         Returns:
             True if word should be excluded
         """
-        for pattern in self.excluded_patterns:
-            if re.fullmatch(pattern, word, re.IGNORECASE):
-                return True
+        if not word:
+            return False
+        if not word.isascii():
+            return _EXCLUDED_RE.fullmatch(word) is not None
+        
+        # Fast paths with C-level str checks; only value literals need the regex
+        first = word[0]
+        if first.isdigit():
+            return word.isdigit() or _EXCLUDED_RE.fullmatch(word) is not None
+        if first.isalpha():
+            return word[1:].isdigit()
         return False
     
     def get_supported_formats(self) -> List[str]:
@@ -1,10 +1,133 @@
 """Rule engine module for applying layout rules based on net classifications."""
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, Iterator, Mapping, Optional, Tuple, Union
 import logging
+import threading
+from types import MappingProxyType
 from config.config_manager import ConfigManager
+from core.net_classifier import Classification
 
 logger = logging.getLogger(__name__)
 
+# Fallback layout rule per category when no rule matches the signal type
+CATEGORY_RULE_MAPPINGS = {
+    'Communication Interface': 'I2C',  # Default for communication
+    'High Speed Interface': 'PCIe',
+    'RF': 'RF',
+    'Power': 'Power'
+}
+
+# Fields every layout rule configuration must define
+REQUIRED_RULE_FIELDS = frozenset({'impedance', 'description'})
+
+# ConfigManager used by engines created without one, and a read-only view of
+# its layout rules shared by those engines, tagged with the config version it
+# was taken from; both are loaded on first use
+_DEFAULT_CONFIG_MANAGER: Optional[ConfigManager] = None
+_DEFAULT_LAYOUT_RULES: Optional[Tuple[int, MappingProxyType]] = None
+_DEFAULT_CONFIG_MANAGER_LOCK = threading.Lock()
+
+# Layout fields taken from the applicable rule -> default when the rule omits them,
+# in output order
+LAYOUT_FIELD_DEFAULTS = {
+    'impedance': '50 Ohm',
+    'description': 'General purpose signal',
+    'width': 'TBD',
+    'length_limit': 'TBD',
+    'spacing': 'TBD',
+    'via_rules': 'Standard',
+    'layer_stack': 'Any',
+    'shielding': 'Optional'
+}
+
+
+@dataclass
+class LayoutInfo(Mapping[str, Any]):
+    """Layout information of a single net.
+
+    Slotted, so large netlists do not carry a dict per net. It is a read-only
+    Mapping over its fields (``info['impedance']``, ``'notes' in info``,
+    ``dict(info)``) for callers written against the former dict results;
+    existing fields can still be assigned with ``info['notes'] = ...``, but
+    keys cannot be added or removed.
+    """
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('net_name', 'category', 'signal_type', 'rule_matched', 'impedance',
+                 'description', 'width', 'length_limit', 'spacing', 'via_rules',
+                 'layer_stack', 'shielding', 'pin_assignment', 'notes', 'priority')
+
+    net_name: str
+    category: str
+    signal_type: str
+    rule_matched: str
+    impedance: Any
+    description: Any
+    width: Any
+    length_limit: Any
+    spacing: Any
+    via_rules: Any
+    layer_stack: Any
+    shielding: Any
+    pin_assignment: Any
+    notes: Any
+    priority: int
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _LAYOUT_INFO_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _LAYOUT_INFO_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _LAYOUT_INFO_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_LAYOUT_INFO_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_LAYOUT_INFO_FIELDS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in _LAYOUT_INFO_FIELDS:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the layout information as a plain dict, e.g. for serialization."""
+        return {name: getattr(self, name) for name in _LAYOUT_INFO_FIELDS}
+
+
+_LAYOUT_INFO_FIELDS = tuple(field.name for field in fields(LayoutInfo))
+
+
+def _get_default_config_manager() -> ConfigManager:
+    """Return the shared default ConfigManager, creating it on first call."""
+    global _DEFAULT_CONFIG_MANAGER
+    if _DEFAULT_CONFIG_MANAGER is None:
+        with _DEFAULT_CONFIG_MANAGER_LOCK:
+            if _DEFAULT_CONFIG_MANAGER is None:
+                _DEFAULT_CONFIG_MANAGER = ConfigManager()
+    return _DEFAULT_CONFIG_MANAGER
+
+
+def _get_default_layout_rules() -> MappingProxyType:
+    """Return a read-only view of the default layout rules, reloading it when the config changed."""
+    global _DEFAULT_LAYOUT_RULES
+    config_manager = _get_default_config_manager()
+    cached = _DEFAULT_LAYOUT_RULES
+    if cached is None or cached[0] != config_manager.config_version:
+        with _DEFAULT_CONFIG_MANAGER_LOCK:
+            rules = config_manager.get_layout_rules()
+            # Read the version after get_layout_rules, which may load the config
+            _DEFAULT_LAYOUT_RULES = cached = (config_manager.config_version,
+                                              MappingProxyType(rules))
+    return cached[1]
+
 
 class RuleEngineError(Exception):
     """Custom exception for rule engine errors."""
@@ -20,29 +143,82 @@ class RuleEngine:
         Args:
             config_manager: Configuration manager providing layout rules.
         """
-        self.config_manager = config_manager or ConfigManager()
-        self.layout_rules = self.config_manager.get_layout_rules()
+        self.config_manager = config_manager or _get_default_config_manager()
+        self._uses_default_rules = config_manager is None
+        # Config version layout_rules was fetched at, and rules added via add_custom_rule
+        self._rules_version: Optional[int] = None
+        self._custom_rules: Dict[str, Dict[str, Any]] = {}
+        # Few (signal_type, category) pairs occur, so resolve each one once
+        self._cached_rule_lookup = lru_cache(maxsize=64)(self._lookup_applicable_rule)
+        self._cached_layout_template = lru_cache(maxsize=64)(self._build_layout_template)
+    
+    @cached_property
+    def layout_rules(self) -> Dict[str, Any]:
+        """Layout rules, fetched from the config manager on first use.
+
+        Engines without their own ConfigManager share a read-only view of the
+        default rules; add_custom_rule copies it on first write. The rules are
+        fetched again once the manager's configuration changes (see
+        ``_sync_rules``).
+        """
+        if self._uses_default_rules:
+            rules = _get_default_layout_rules()
+        else:
+            rules = self.config_manager.get_layout_rules()
+        self._rules_version = self.config_manager.config_version
+        return rules
+    
+    def _sync_rules(self) -> None:
+        """Drop rules and cached lookups taken from an outdated configuration.
+
+        Custom rules are re-applied on top of the reloaded rules.
+        """
+        if ('layout_rules' not in self.__dict__
+                or self._rules_version == self.config_manager.config_version):
+            return
+        
+        del self.layout_rules
+        for rule_type, rule_config in self._custom_rules.items():
+            self._store_rule(rule_type, rule_config)
+        self._cached_rule_lookup.cache_clear()
+        self._cached_layout_template.cache_clear()
+    
+    def _store_rule(self, rule_type: str, rule_config: Dict[str, Any]) -> None:
+        """Set a rule in layout_rules, copying the shared read-only view first."""
+        if isinstance(self.layout_rules, MappingProxyType):
+            self.layout_rules = dict(self.layout_rules)
+        self.layout_rules[rule_type] = rule_config
     
-    def apply_rules(self, classified_nets: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def apply_rules(self, classified_nets: Dict[str, Union[Classification, Mapping[str, Any]]]
+                    ) -> Dict[str, LayoutInfo]:
         """
         Apply layout rules to classified networks.
         
         Args:
-            classified_nets: Dictionary of classified nets from NetClassifier
+            classified_nets: Dictionary of classified nets from NetClassifier; plain
+                dict classifications, including partial ones, are also accepted
             
         Returns:
             Dictionary with net names mapped to complete layout information
         """
-        results = {}
+        self._sync_rules()
+        
+        # Convert dict classifications once, so the per-net path only sees attributes
+        if any(isinstance(classification, Mapping) for classification in classified_nets.values()):
+            classified_nets = {
+                net_name: (Classification.from_dict(classification)
+                           if isinstance(classification, Mapping) else classification)
+                for net_name, classification in classified_nets.items()
+            }
         
-        for net_name, classification in classified_nets.items():
-            layout_info = self._apply_single_rule(net_name, classification)
-            results[net_name] = layout_info
+        apply_rule = self._apply_single_rule
+        results = {net_name: apply_rule(net_name, classification)
+                   for net_name, classification in classified_nets.items()}
         
         logger.info(f"Applied layout rules to {len(classified_nets)} nets")
         return results
     
-    def _apply_single_rule(self, net_name: str, classification: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_single_rule(self, net_name: str, classification: Classification) -> LayoutInfo:
         """
         Apply layout rule to a single net.
         
@@ -53,37 +229,42 @@ class RuleEngine:
         Returns:
             Complete layout information for the net
         """
-        signal_type = classification.get('signal_type', 'Single-End')
-        category = classification.get('category', 'Other')
+        signal_type = classification.signal_type
+        category = classification.category
         
-        # Find applicable layout rule
-        rule_config = self._find_applicable_rule(signal_type, category)
-        
-        # Build complete layout information
-        layout_info = {
+        # Build complete layout information; the rule-derived fields come
+        # pre-defaulted from the cached template of the applicable rule
+        return LayoutInfo(
             # Original classification info
-            'net_name': net_name,
-            'category': category,
-            'signal_type': signal_type,
-            'rule_matched': classification.get('rule_matched', 'default'),
+            net_name=net_name,
+            category=category,
+            signal_type=signal_type,
+            rule_matched=classification.rule_matched,
             
-            # Layout rule information
-            'impedance': rule_config.get('impedance', '50 Ohm'),
-            'description': rule_config.get('description', 'General purpose signal'),
-            'width': rule_config.get('width', 'TBD'),
-            'length_limit': rule_config.get('length_limit', 'TBD'),
-            'spacing': rule_config.get('spacing', 'TBD'),
-            'via_rules': rule_config.get('via_rules', 'Standard'),
-            'layer_stack': rule_config.get('layer_stack', 'Any'),
-            'shielding': rule_config.get('shielding', 'Optional'),
+            # Layout rule information and additional fields for Excel output
+            **self._cached_layout_template(signal_type, category),
+            priority=classification.priority
+        )
+    
+    def _build_layout_template(self, signal_type: str, category: str) -> Dict[str, Any]:
+        """
+        Build the rule-derived part of the layout information for a signal type and category.
+        
+        Args:
+            signal_type: Type of signal (I2C, SPI, RF, etc.)
+            category: Category of the net
             
-            # Additional fields for Excel output
-            'pin_assignment': 'TBD',
-            'notes': rule_config.get('notes', ''),
-            'priority': classification.get('priority', 999)
-        }
+        Returns:
+            Layout fields with defaults filled in, in output order
+        """
+        rule_config = self._find_applicable_rule(signal_type, category)
+        template = {field: rule_config.get(field, default)
+                    for field, default in LAYOUT_FIELD_DEFAULTS.items()}
         
-        return layout_info
+        # Additional fields for Excel output
+        template['pin_assignment'] = 'TBD'
+        template['notes'] = rule_config.get('notes', '')
+        return template
     
     def _find_applicable_rule(self, signal_type: str, category: str) -> Dict[str, Any]:
         """
@@ -96,19 +277,16 @@ class RuleEngine:
         Returns:
             Layout rule configuration
         """
+        return self._cached_rule_lookup(signal_type, category)
+    
+    def _lookup_applicable_rule(self, signal_type: str, category: str) -> Dict[str, Any]:
+        """Uncached rule resolution behind ``_find_applicable_rule``."""
         # First try to match by signal type
         if signal_type in self.layout_rules:
             return self.layout_rules[signal_type]
         
         # Then try to match by category
-        category_mappings = {
-            'Communication Interface': 'I2C',  # Default for communication
-            'High Speed Interface': 'PCIe',
-            'RF': 'RF',
-            'Power': 'Power'
-        }
-        
-        mapped_type = category_mappings.get(category)
+        mapped_type = CATEGORY_RULE_MAPPINGS.get(category)
         if mapped_type and mapped_type in self.layout_rules:
             return self.layout_rules[mapped_type]
         
@@ -123,7 +301,11 @@ class RuleEngine:
             rule_type: Type/name of the rule
             rule_config: Rule configuration dictionary
         """
-        self.layout_rules[rule_type] = rule_config
+        self._sync_rules()
+        self._custom_rules[rule_type] = rule_config
+        self._store_rule(rule_type, rule_config)
+        self._cached_rule_lookup.cache_clear()
+        self._cached_layout_template.cache_clear()
         logger.info(f"Added custom layout rule: {rule_type}")
     
     def validate_rule_config(self, rule_config: Dict[str, Any]) -> bool:
@@ -136,11 +318,10 @@ class RuleEngine:
         Returns:
             True if configuration is valid
         """
-        required_fields = ['impedance', 'description']
-        for field in required_fields:
-            if field not in rule_config:
-                logger.error(f"Missing required field '{field}' in rule config")
-                return False
+        missing = REQUIRED_RULE_FIELDS.difference(rule_config)
+        if missing:
+            logger.error(f"Missing required fields {sorted(missing)} in rule config")
+            return False
         
         return True
     
@@ -1,13 +1,73 @@
 """
 Template mapper module for mapping processed data to Excel templates.
 """
-from typing import Dict, Any, Optional, List
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Optional, List, Sequence, Tuple
 from pathlib import Path
-import pandas as pd
 import logging
 
+# pandas/numpy are imported where a DataFrame is actually built or read, so
+# importing this module (e.g. for the CLI entry point) stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Layout data key -> (output column, default when missing), in output order;
+# 'Net Name' comes from the layout data keys and is inserted second
+_LAYOUT_COLUMNS = {
+    'category': ('Category', 'Other'),
+    'pin_assignment': ('Pin (MT7921)', 'TBD'),
+    'description': ('Description', ''),
+    'impedance': ('Impedance', '50 Ohm'),
+    'signal_type': ('Type', 'Single-End'),
+    'width': ('Width', 'TBD'),
+    'length_limit': ('Length Limit (mil)', 'TBD'),
+    'spacing': ('Spacing', 'TBD'),
+    'shielding': ('Shielding', 'Optional'),
+    'layer_stack': ('Layer Stack', 'Any'),
+    'notes': ('Notes', ''),
+    'priority': ('priority', 999)  # For sorting, will be removed
+}
+
+# Defaults of the _LAYOUT_COLUMNS fields, in the same order
+_LAYOUT_DEFAULTS = tuple(default for _, default in _LAYOUT_COLUMNS.values())
+
+# Reads the _LAYOUT_COLUMNS fields of a LayoutInfo as one tuple
+_get_layout_fields = attrgetter(*_LAYOUT_COLUMNS)
+
+
+def _sort_priority(priority: Any) -> Any:
+    """Sort key of a net's priority; an explicit None sorts like the default."""
+    return _LAYOUT_COLUMNS['priority'][1] if priority is None else priority
+
+
+# Column order of the generated layout guide
+_OUTPUT_COLUMNS = (
+    'Category',
+    'Net Name',
+    'Pin (MT7921)',
+    'Description',
+    'Impedance',
+    'Type',
+    'Width',
+    'Length Limit (mil)',
+    'Spacing',
+    'Shielding',
+    'Layer Stack',
+    'Notes'
+)
+
+# Header cell format for workbooks written with xlsxwriter
+_XLSX_HEADER_FORMAT = {
+    'bold': True,
+    'font_color': '#FFFFFF',
+    'bg_color': '#366092',
+    'align': 'center',
+    'valign': 'vcenter'
+}
+
 
 class TemplateMappingError(Exception):
     """Custom exception for template mapping errors."""
@@ -28,9 +88,10 @@ class TemplateMapper:
         self.column_mapping = self.config.get('template_mapping', {}).get('columns', {})
     
     def map_to_template(self, 
-                       layout_data: Dict[str, Dict[str, Any]], 
+                       layout_data: Dict[str, Any], 
                        template_path: Optional[Path] = None,
-                       output_path: Optional[Path] = None) -> Path:
+                       output_path: Optional[Path] = None,
+                       streaming: bool = False) -> Path:
         """
         Map processed layout data to Excel template format.
         
@@ -38,6 +99,9 @@ class TemplateMapper:
             layout_data: Processed data from RuleEngine
             template_path: Path to Excel template (optional)
             output_path: Path for output Excel file
+            streaming: Write rows straight to the workbook with xlsxwriter in
+                constant-memory mode instead of building a DataFrame; falls back
+                to the DataFrame path if xlsxwriter is not installed
             
         Returns:
             Path to the generated Excel file
@@ -46,22 +110,27 @@ class TemplateMapper:
             TemplateMappingError: If mapping fails
         """
         try:
-            # Convert layout data to DataFrame format
-            df_data = self._convert_to_dataframe_format(layout_data)
+            # Determine output path
+            if output_path is None:
+                output_path = Path.cwd() / "layout_guide_output.xlsx"
+            
+            if streaming and self._stream_to_excel(layout_data, output_path):
+                logger.info(f"Successfully streamed {len(layout_data)} nets to Excel template: {output_path}")
+                return output_path
             
-            # Create DataFrame
-            df = pd.DataFrame(df_data)
+            # Convert layout data to a DataFrame
+            df = self._convert_to_dataframe_format(layout_data)
             
-            # Sort by priority and then by net name
-            df = df.sort_values(['priority', 'Net Name'])
+            # Sort by priority and then by net name; only the two key columns are
+            # sorted, and the rows are gathered once
+            import numpy as np
+            priority = df['priority'].fillna(_LAYOUT_COLUMNS['priority'][1])
+            order = np.lexsort((df['Net Name'].to_numpy(), priority.to_numpy()))
+            df = df.take(order)
             
             # Reorder columns according to template mapping
             df = self._reorder_columns(df)
             
-            # Determine output path
-            if output_path is None:
-                output_path = Path.cwd() / "layout_guide_output.xlsx"
-            
             # Save to Excel
             self._save_to_excel(df, output_path)
             
@@ -71,39 +140,93 @@ class TemplateMapper:
         except Exception as e:
             raise TemplateMappingError(f"Failed to map data to template: {str(e)}")
     
-    def _convert_to_dataframe_format(self, layout_data: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _convert_to_dataframe_format(self, layout_data: Dict[str, Any]) -> 'pd.DataFrame':
         """
-        Convert layout data to format suitable for DataFrame.
+        Convert layout data to a DataFrame with output column names.
         
         Args:
             layout_data: Layout data from RuleEngine
             
         Returns:
-            List of dictionaries for DataFrame creation
+            DataFrame with one row per net, plus a 'priority' column for sorting
         """
-        df_data = []
+        import pandas as pd
         
-        for net_name, net_info in layout_data.items():
-            row_data = {
-                'Category': net_info.get('category', 'Other'),
-                'Net Name': net_name,
-                'Pin (MT7921)': net_info.get('pin_assignment', 'TBD'),
-                'Description': net_info.get('description', ''),
-                'Impedance': net_info.get('impedance', '50 Ohm'),
-                'Type': net_info.get('signal_type', 'Single-End'),
-                'Width': net_info.get('width', 'TBD'),
-                'Length Limit (mil)': net_info.get('length_limit', 'TBD'),
-                'Spacing': net_info.get('spacing', 'TBD'),
-                'Shielding': net_info.get('shielding', 'Optional'),
-                'Layer Stack': net_info.get('layer_stack', 'Any'),
-                'Notes': net_info.get('notes', ''),
-                'priority': net_info.get('priority', 999)  # For sorting, will be removed
-            }
-            df_data.append(row_data)
+        df = pd.DataFrame(self._layout_rows(layout_data), columns=list(_LAYOUT_COLUMNS))
+        df = df.rename(columns={key: column for key, (column, _) in _LAYOUT_COLUMNS.items()})
+        df.insert(1, 'Net Name', list(layout_data))
+        return df
+    
+    @staticmethod
+    def _layout_rows(layout_data: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+        """
+        Read the _LAYOUT_COLUMNS fields of every net.
         
-        return df_data
+        Nets may be LayoutInfo objects or dicts, mixed freely. Keys missing from
+        a dict get their default; explicit None values are kept, as written.
+        
+        Args:
+            layout_data: Layout data from RuleEngine
+            
+        Returns:
+            One tuple per net, in _LAYOUT_COLUMNS order ('priority' last)
+        """
+        rows = []
+        for net_info in layout_data.values():
+            if isinstance(net_info, dict):
+                rows.append(tuple(net_info.get(key, default)
+                                  for key, default in zip(_LAYOUT_COLUMNS, _LAYOUT_DEFAULTS)))
+            else:
+                # LayoutInfo carries every field; one attrgetter call beats item access per field
+                rows.append(_get_layout_fields(net_info))
+        return rows
     
-    def _reorder_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _stream_to_excel(self, layout_data: Dict[str, Any], output_path: Path) -> bool:
+        """
+        Write layout data to Excel row by row with xlsxwriter, without a DataFrame.
+        
+        Rows, order, defaults and formatting match the DataFrame path.
+        
+        Args:
+            layout_data: Layout data from RuleEngine
+            output_path: Path for output file
+            
+        Returns:
+            False if xlsxwriter is not available and nothing was written
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            return False
+        
+        headers = [column for column, _ in _LAYOUT_COLUMNS.values()][:-1]
+        headers.insert(1, 'Net Name')
+        
+        # (priority, net name, row values), sorted by priority and then by net name
+        rows = []
+        for net_name, row in zip(layout_data, self._layout_rows(layout_data)):
+            values = list(row[:-1])
+            values.insert(1, net_name)
+            rows.append((_sort_priority(row[-1]), net_name, values))
+        rows.sort(key=lambda row: (row[0], row[1]))
+        
+        workbook = xlsxwriter.Workbook(str(output_path), {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet('Layout Guide')
+            
+            # Column widths go first; constant-memory mode flushes each row once written
+            widths = self._column_widths(headers, (values for _, _, values in rows))
+            for col, width in enumerate(widths):
+                worksheet.set_column(col, col, width)
+            
+            worksheet.write_row(0, 0, headers, workbook.add_format(_XLSX_HEADER_FORMAT))
+            for row, (_, _, values) in enumerate(rows, start=1):
+                worksheet.write_row(row, 0, values)
+        finally:
+            workbook.close()
+        return True
+    
+    def _reorder_columns(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
         """
         Reorder DataFrame columns according to template mapping.
         
@@ -113,29 +236,11 @@ class TemplateMapper:
         Returns:
             DataFrame with reordered columns
         """
-        # Define desired column order
-        desired_order = [
-            'Category',
-            'Net Name', 
-            'Pin (MT7921)',
-            'Description',
-            'Impedance',
-            'Type',
-            'Width',
-            'Length Limit (mil)',
-            'Spacing',
-            'Shielding',
-            'Layer Stack',
-            'Notes'
-        ]
-        
-        # Keep only columns that exist in the DataFrame
-        available_cols = [col for col in desired_order if col in df.columns]
-        
-        # Return DataFrame with reordered columns
-        return df[available_cols]
+        # Keep only columns that exist in the DataFrame, in output order
+        columns = df.columns
+        return df[[col for col in _OUTPUT_COLUMNS if col in columns]]
     
-    def _save_to_excel(self, df: pd.DataFrame, output_path: Path) -> None:
+    def _save_to_excel(self, df: 'pd.DataFrame', output_path: Path) -> None:
         """
         Save DataFrame to Excel file with formatting.
         
@@ -144,28 +249,47 @@ class TemplateMapper:
             output_path: Path for output file
         """
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            # Prefer xlsxwriter: it serialises faster and keeps less per-cell
+            # state than openpyxl. constant_memory is not enabled because
+            # pandas writes cells column by column, which that mode drops.
+            try:
+                import xlsxwriter  # noqa: F401
+                engine = 'xlsxwriter'
+            except ImportError:
+                engine = 'openpyxl'
+            
+            import pandas as pd
+            
+            with pd.ExcelWriter(output_path, engine=engine) as writer:
                 df.to_excel(writer, sheet_name='Layout Guide', index=False)
                 
-                # Get the workbook and worksheet for formatting
-                workbook = writer.book
-                worksheet = writer.sheets['Layout Guide']
-                
-                # Apply basic formatting
-                self._apply_excel_formatting(worksheet, len(df))
+                # Formatting problems must not reach the fallback below, which
+                # would serialize the already written data a second time
+                try:
+                    # Get the workbook and worksheet for formatting
+                    workbook = writer.book
+                    worksheet = writer.sheets['Layout Guide']
+                    
+                    # Apply basic formatting
+                    if engine == 'xlsxwriter':
+                        self._apply_xlsxwriter_formatting(workbook, worksheet, df)
+                    else:
+                        self._apply_excel_formatting(worksheet, df)
+                except Exception as e:
+                    logger.warning(f"Error applying Excel formatting: {e}")
                 
         except Exception as e:
             logger.error(f"Error saving Excel file: {e}")
-            # Fallback to basic save without formatting
+            # Writing the data itself failed; fall back to a basic save without formatting
             df.to_excel(output_path, index=False)
     
-    def _apply_excel_formatting(self, worksheet, row_count: int) -> None:
+    def _apply_excel_formatting(self, worksheet, df: 'pd.DataFrame') -> None:
         """
         Apply basic formatting to Excel worksheet.
         
         Args:
             worksheet: openpyxl worksheet object
-            row_count: Number of data rows
+            df: DataFrame that was written to the worksheet
         """
         try:
             from openpyxl.styles import Font, PatternFill, Alignment
@@ -182,24 +306,64 @@ class TemplateMapper:
                 cell.alignment = Alignment(horizontal="center", vertical="center")
             
             # Auto-adjust column widths
-            for col in range(1, worksheet.max_column + 1):
-                column_letter = get_column_letter(col)
-                max_length = 0
-                
-                for row in range(1, min(row_count + 2, 100)):  # Limit check to first 100 rows
-                    cell_value = worksheet.cell(row=row, column=col).value
-                    if cell_value:
-                        max_length = max(max_length, len(str(cell_value)))
-                
-                # Set column width with reasonable limits
-                adjusted_width = min(max(max_length + 2, 10), 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            for col, width in enumerate(self._df_column_widths(df), start=1):
+                worksheet.column_dimensions[get_column_letter(col)].width = width
             
         except ImportError:
             logger.warning("openpyxl.styles not available, skipping Excel formatting")
         except Exception as e:
             logger.warning(f"Error applying Excel formatting: {e}")
     
+    def _apply_xlsxwriter_formatting(self, workbook, worksheet, df: 'pd.DataFrame') -> None:
+        """
+        Apply basic formatting to an xlsxwriter worksheet.
+        
+        Args:
+            workbook: xlsxwriter workbook object
+            worksheet: xlsxwriter worksheet object
+            df: DataFrame that was written to the worksheet
+        """
+        try:
+            # Header formatting
+            header_format = workbook.add_format(_XLSX_HEADER_FORMAT)
+            
+            for col, header in enumerate(df.columns):
+                worksheet.write(0, col, header, header_format)
+            
+            # Auto-adjust column widths
+            for col, width in enumerate(self._df_column_widths(df)):
+                worksheet.set_column(col, col, width)
+            
+        except Exception as e:
+            logger.warning(f"Error applying Excel formatting: {e}")
+    
+    @classmethod
+    def _df_column_widths(cls, df: 'pd.DataFrame') -> List[int]:
+        """Compute Excel column widths for a DataFrame being written."""
+        return cls._column_widths(df.columns, df.itertuples(index=False, name=None))
+    
+    @staticmethod
+    def _column_widths(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[int]:
+        """
+        Compute Excel column widths from the header and the first rows of data.
+        
+        Args:
+            headers: Column headers
+            rows: Data rows, in header order
+            
+        Returns:
+            Width per column, between 10 and 50 characters
+        """
+        # Limit check to the header plus first 98 data rows; empty cells count as zero
+        max_lengths = [len(str(header)) for header in headers]
+        for values in islice(rows, 98):
+            for col, value in enumerate(values):
+                # None and NaN (value != value) are written as empty cells
+                if value is not None and value == value:
+                    max_lengths[col] = max(max_lengths[col], len(str(value)))
+        # Set column width with reasonable limits
+        return [min(max(max_length + 2, 10), 50) for max_length in max_lengths]
+    
     def validate_template(self, template_path: Path) -> bool:
         """
         Validate if the Excel template has expected structure.
@@ -215,15 +379,12 @@ class TemplateMapper:
                 logger.error(f"Template file not found: {template_path}")
                 return False
             
-            # Try to read the template
-            df = pd.read_excel(template_path)
+            import pandas as pd
             
-            # Check if template has minimum required columns
-            required_columns = ['Category', 'Net Name', 'Description']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            # Only the header row is needed to check the column layout
+            df = pd.read_excel(template_path, nrows=0)
             
-            if missing_columns:
-                logger.error(f"Template missing required columns: {missing_columns}")
+            if not self._has_required_columns(df.columns):
                 return False
             
             logger.info(f"Template validation successful: {template_path}")
@@ -233,6 +394,24 @@ class TemplateMapper:
             logger.error(f"Template validation failed: {e}")
             return False
     
+    def _has_required_columns(self, columns) -> bool:
+        """
+        Check that template header columns include the minimum required columns.
+        
+        Args:
+            columns: Header column names already read from the template
+            
+        Returns:
+            True if no required column is missing
+        """
+        required_columns = ['Category', 'Net Name', 'Description']
+        missing_columns = [col for col in required_columns if col not in columns]
+        
+        if missing_columns:
+            logger.error(f"Template missing required columns: {missing_columns}")
+            return False
+        return True
+    
     def get_template_info(self, template_path: Path) -> Dict[str, Any]:
         """
         Get information about a template file.
@@ -244,12 +423,24 @@ class TemplateMapper:
             Dictionary with template information
         """
         try:
-            df = pd.read_excel(template_path)
+            from openpyxl import load_workbook
+            
+            # Probe metadata in read-only mode instead of parsing the sheet into pandas
+            workbook = load_workbook(template_path, read_only=True, data_only=True)
+            try:
+                rows = workbook.worksheets[0].iter_rows(values_only=True)
+                header = next(rows, ())
+                columns = [col for col in header if col is not None]
+                row_count = sum(1 for row in rows if any(value is not None for value in row))
+            finally:
+                workbook.close()
+            
             return {
-                'columns': list(df.columns),
-                'row_count': len(df),
+                'columns': columns,
+                'row_count': row_count,
                 'file_size': template_path.stat().st_size,
-                'valid': self.validate_template(template_path)
+                # Validate the header already read instead of parsing the file again
+                'valid': self._has_required_columns(columns)
             }
         except Exception as e:
             return {'error': str(e), 'valid': False}
@@ -3,7 +3,7 @@ Main entry point for the Impedance Control Layout Guide Generator.
 整合所有模組的主要程式入口
 """
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import logging
 import sys
 
@@ -18,14 +18,13 @@ else:
     # Running in development
     sys.path.insert(0, str(Path(__file__).parent))
 
-from core.netlist_parser import NetlistParser
-from core.net_classifier import NetClassifier  
-from core.rule_engine import RuleEngine
-from core.template_mapper import TemplateMapper
-from config.config_manager import ConfigManager
+# The pipeline modules (and jsonschema/yaml behind ConfigManager) are imported
+# in process_netlist_to_excel, so `main.py --help` starts without them
+if TYPE_CHECKING:
+    from config.config_manager import ConfigManager
 
 
-def setup_logging(config_manager: ConfigManager) -> None:
+def setup_logging(config_manager: 'ConfigManager') -> None:
     """Set up logging configuration."""
     log_config = config_manager.get_section('logging')
     
@@ -68,6 +67,8 @@ def process_netlist_to_excel(netlist_path: Path,
     Returns:
         Path to generated Excel file
     """
+    from config.config_manager import ConfigManager
+    
     # Load configuration
     config_manager = ConfigManager(config_path)
     config = config_manager.load_config()
@@ -81,6 +82,7 @@ def process_netlist_to_excel(netlist_path: Path,
     try:
         # Step 1: Parse netlist
         logger.info("步驟 1: 解析 Netlist 檔案")
+        from core.netlist_parser import NetlistParser
         parser_config = config_manager.get_section('netlist_parser')
         parser = NetlistParser(parser_config)
         net_names = parser.parse(netlist_path)
@@ -88,6 +90,7 @@ def process_netlist_to_excel(netlist_path: Path,
         
         # Step 2: Classify nets
         logger.info("步驟 2: 分類網路名稱")
+        from core.net_classifier import NetClassifier
         classifier = NetClassifier(config_manager)
         classified_nets = classifier.classify(net_names)
         
@@ -98,11 +101,13 @@ def process_netlist_to_excel(netlist_path: Path,
         
         # Step 3: Apply layout rules
         logger.info("步驟 3: 應用佈局規則")
+        from core.rule_engine import RuleEngine
         rule_engine = RuleEngine(config_manager)
         layout_data = rule_engine.apply_rules(classified_nets)
         
         # Step 4: Map to Excel template
         logger.info("步驟 4: 生成 Excel 檔案")
+        from core.template_mapper import TemplateMapper
         template_mapper = TemplateMapper(config)
         output_file = template_mapper.map_to_template(
             layout_data, 
@@ -3,15 +3,25 @@ Configuration Model for managing YAML configuration data
 配置模型，用於管理YAML配置資料
 """
 
+import json
+import os
 import yaml
-import copy
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 import logging
 
+from config.config_manager import ConfigManager, YamlDumper, read_yaml_cached
+
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it parses and encodes UTF-8 bytes directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from models.signal_rule_model import SignalRuleModel
 from models.layout_rule_model import LayoutRuleModel
 from models.template_mapping_model import TemplateMappingModel
@@ -46,19 +56,10 @@ class ConfigurationModel(QObject):
     def _load_default_config(self):
         """Load default configuration from default_config.yaml"""
         try:
-            # Check if running in PyInstaller bundle
-            import sys
-            if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                # Running in PyInstaller bundle
-                default_config_path = Path(sys._MEIPASS) / "src" / "config" / "default_config.yaml"
+            if ConfigManager.default_config_path.exists():
+                self.load_config(ConfigManager.default_config_path)
             else:
-                # Running in development
-                default_config_path = Path(__file__).parent.parent / "config" / "default_config.yaml"
-            
-            if default_config_path.exists():
-                self.load_config(default_config_path)
-            else:
-                logger.warning(f"Config file not found at {default_config_path}")
+                logger.warning(f"Config file not found at {ConfigManager.default_config_path}")
         except Exception as e:
             logger.warning(f"Could not load default config: {e}")
     
@@ -68,21 +69,48 @@ class ConfigurationModel(QObject):
         從YAML檔案載入配置
         """
         try:
-            # Ensure config_path is a proper file path
-            if not isinstance(config_path, (Path, str)):
-                raise ValueError(f"config_path must be a Path or str, got {type(config_path)}: {config_path}")
-            
-            # Convert to Path object if it's a string
-            if isinstance(config_path, str):
-                config_path = Path(config_path)
-            
-            # Validate the path exists
-            if not config_path.exists():
-                raise FileNotFoundError(f"Configuration file not found: {config_path}")
+            config_data = self.read_config_file(config_path)
+            return self.apply_config_data(config_data, Path(config_path))
             
+        except Exception as e:
+            error_msg = f"Failed to load config from {config_path}: {str(e)}"
+            self.validationError.emit(error_msg)
+            return False
+    
+    @staticmethod
+    def read_config_file(config_path: Path) -> Dict[str, Any]:
+        """
+        Read raw configuration data from YAML file without touching model state
+        讀取YAML檔案的原始配置資料，不修改模型狀態
+        
+        Files with a .json suffix are parsed as JSON. Safe to call from a worker thread.
+        """
+        # Ensure config_path is a proper file path
+        if not isinstance(config_path, (Path, str)):
+            raise ValueError(f"config_path must be a Path or str, got {type(config_path)}: {config_path}")
+        
+        # Convert to Path object if it's a string
+        if isinstance(config_path, str):
+            config_path = Path(config_path)
+        
+        # Validate the path exists
+        if not config_path.exists():
+            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        
+        if config_path.suffix.lower() == '.json':
+            if orjson is not None:
+                return orjson.loads(config_path.read_bytes())
             with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
-            
+                return json.load(file)
+        
+        return read_yaml_cached(config_path)
+    
+    def apply_config_data(self, config_data: Dict[str, Any], config_path: Path) -> bool:
+        """
+        Apply configuration data read from config_path to the model
+        將從檔案讀取的配置資料套用到模型
+        """
+        try:
             self._parse_config_data(config_data)
             self.config_file_path = config_path
             
@@ -109,11 +137,29 @@ class ConfigurationModel(QObject):
             
             config_data = self._build_config_data()
             
-            with open(config_path, 'w', encoding='utf-8') as file:
-                yaml.safe_dump(config_data, file, 
-                             default_flow_style=False, 
-                             allow_unicode=True,
-                             indent=2)
+            # Encode the whole document in memory and write it with one call
+            if Path(config_path).suffix.lower() == '.json':
+                if orjson is not None:
+                    payload = orjson.dumps(config_data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                payload = yaml.dump(config_data,
+                                    Dumper=YamlDumper,
+                                    default_flow_style=False,
+                                    allow_unicode=True,
+                                    indent=2,
+                                    encoding='utf-8')
+            
+            # Write to a sibling temp file and swap it in, so a failed save
+            # never leaves a truncated config behind
+            config_path = Path(config_path)
+            temp_path = config_path.with_name(config_path.name + '.tmp')
+            try:
+                temp_path.write_bytes(payload)
+                os.replace(temp_path, config_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
             
             self.config_file_path = config_path
             self.configSaved.emit(str(config_path))
@@ -232,26 +278,20 @@ class ConfigurationModel(QObject):
     
     def validate_config(self) -> List[str]:
         """Validate current configuration and return list of errors"""
-        errors = []
-        
-        # Validate signal rules
-        for rule_name, signal_rule in self.signal_rules.items():
-            rule_errors = signal_rule.validate()
-            if rule_errors:
-                errors.extend([f"Signal rule '{rule_name}': {error}" for error in rule_errors])
-        
-        # Validate layout rules
-        for rule_name, layout_rule in self.layout_rules.items():
-            rule_errors = layout_rule.validate()
-            if rule_errors:
-                errors.extend([f"Layout rule '{rule_name}': {error}" for error in rule_errors])
-        
-        # Validate template mapping
-        template_errors = self.template_mapping.validate() 
-        if template_errors:
-            errors.extend([f"Template mapping: {error}" for error in template_errors])
-        
-        return errors
+        return list(chain(
+            # Validate signal rules
+            (f"Signal rule '{rule_name}': {error}"
+             for rule_name, signal_rule in self.signal_rules.items()
+             for error in signal_rule.validate()),
+            
+            # Validate layout rules
+            (f"Layout rule '{rule_name}': {error}"
+             for rule_name, layout_rule in self.layout_rules.items()
+             for error in layout_rule.validate()),
+            
+            # Validate template mapping
+            (f"Template mapping: {error}" for error in self.template_mapping.validate())
+        ))
     
     def get_config_summary(self) -> Dict[str, Any]:
         """Get a summary of current configuration"""
@@ -3,10 +3,14 @@ Layout Rule Model for managing layout design rules
 佈局規則模型，用於管理佈局設計規則
 """
 
-from dataclasses import dataclass, field, fields
+import re
+from dataclasses import dataclass, field, fields, replace
 from typing import Any, ClassVar, Dict, List, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 
+# First number in an impedance string, e.g. "50" in "50 Ohm"
+_IMPEDANCE_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+
 
 @dataclass(eq=False)
 class LayoutRuleModel(QObject):
@@ -18,6 +22,11 @@ class LayoutRuleModel(QObject):
     # Signals for notifying changes
     dataChanged: ClassVar[pyqtSignal] = pyqtSignal()
 
+    # Fields loaded by load_from_dict (all but name), and fields update() may
+    # set (all of them); both are set after the class body
+    _FIELD_NAMES: ClassVar[tuple]
+    _UPDATE_KEYS: ClassVar[frozenset]
+
     name: str = ""
     impedance: str = "50 Ohm"
     description: str = ""
@@ -43,18 +52,18 @@ class LayoutRuleModel(QObject):
     def load_from_dict(self, name: str, data: Dict[str, Any]):
         """Load layout rule from dictionary data"""
         self.name = name
-        updates = {
-            f.name: data.get(f.name, getattr(self, f.name))
-            for f in fields(self) if f.name != 'name'
-        }
+        updates = {key: data[key] for key in self._FIELD_NAMES if key in data}
         self.update(**updates)
 
     def update(self, **kwargs: Any):
         """Batch update attributes and emit change signal if modified"""
+        # Dataclass fields live in the instance dict, so read and write it directly
+        attributes = self.__dict__
+        valid_keys = self._UPDATE_KEYS
         changed = False
         for key, value in kwargs.items():
-            if hasattr(self, key) and getattr(self, key) != value:
-                setattr(self, key, value)
+            if key in valid_keys and attributes[key] != value:
+                attributes[key] = value
                 changed = True
         if changed:
             self.dataChanged.emit()
@@ -157,20 +166,20 @@ class LayoutRuleModel(QObject):
         """Extract numerical impedance value"""
         try:
             # Extract number from impedance string
-            import re
-            match = re.search(r'(\d+(?:\.\d+)?)', self.impedance)
+            match = _IMPEDANCE_NUMBER.search(self.impedance)
             if match:
                 return float(match.group(1))
-        except:
+        except (TypeError, ValueError):
             pass
         return None
     
     def clone(self) -> 'LayoutRuleModel':
         """Create a copy of this layout rule"""
-        data = self.to_dict()
-        data['name'] = f"{self.name}_copy"
-        if 'required_layers' in data:
-            data['required_layers'] = data['required_layers'].copy()
-        new_rule = LayoutRuleModel()
-        new_rule.load_from_dict(data['name'], data)
-        return new_rule
+        # copy.copy cannot duplicate the underlying QObject; replace() builds a
+        # fresh instance from this one's field values in a single __init__ call
+        return replace(self, name=f"{self.name}_copy",
+                       required_layers=list(self.required_layers))
+
+
+LayoutRuleModel._FIELD_NAMES = tuple(f.name for f in fields(LayoutRuleModel) if f.name != 'name')
+LayoutRuleModel._UPDATE_KEYS = frozenset(LayoutRuleModel._FIELD_NAMES) | {'name'}
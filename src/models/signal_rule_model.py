@@ -3,9 +3,12 @@ Signal Rule Model for managing signal classification rules
 信號規則模型，用於管理信號分類規則
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from typing import Any, Callable, Dict, List, Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from core.net_classifier import fuse_patterns
+
 
 class SignalRuleModel(QObject):
     """
@@ -27,6 +30,13 @@ class SignalRuleModel(QObject):
         self.priority: int = 10
         self.description: str = ""
         self.enabled: bool = True
+        
+        # Predicate built by compile_matcher, dropped whenever the rule changes
+        self._compiled_matcher: Optional[Callable[[str], Any]] = None
+        self.dataChanged.connect(self._invalidate_matcher)
+    
+    def _invalidate_matcher(self):
+        self._compiled_matcher = None
     
     def load_from_dict(self, name: str, data: Dict[str, Any]):
         """Load signal rule from dictionary data"""
@@ -180,6 +190,46 @@ class SignalRuleModel(QObject):
         
         return False
     
+    def compile_matcher(self) -> Callable[[str], Any]:
+        """
+        Return a predicate equivalent to matches_net for filtering many nets
+        
+        Exact matches, keywords and valid patterns are fused into one
+        case-insensitive regex, compiled once and reused until the rule changes.
+        
+        Returns:
+            Callable returning a truthy value for matching net names
+        """
+        if self._compiled_matcher is None:
+            self._compiled_matcher = self._build_matcher()
+        return self._compiled_matcher
+    
+    def _build_matcher(self) -> Callable[[str], Any]:
+        """Build the predicate returned by compile_matcher"""
+        if not self.enabled:
+            return lambda net_name: False
+        
+        alternatives = []
+        if self.exact_matches:
+            exact = '|'.join(re.escape(match) for match in self.exact_matches)
+            alternatives.append(rf'\A(?:{exact})\Z')
+        alternatives.extend(re.escape(keyword) for keyword in self.keywords)
+        for pattern in self.patterns:
+            try:
+                re.compile(pattern)
+            except re.error:
+                # matches_net skips invalid patterns too
+                continue
+            alternatives.append(pattern)
+        
+        if not alternatives:
+            return lambda net_name: False
+        
+        fused = fuse_patterns(alternatives)
+        if fused is None:
+            return self.matches_net
+        return fused.search
+    
     def get_summary(self) -> str:
         """Get a summary string for this rule"""
         enabled_str = "✓" if self.enabled else "✗"
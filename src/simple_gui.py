@@ -9,7 +9,39 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLineEdit, QLabel, QTextEdit, QFileDialog,
                              QMessageBox)
 from PyQt5.QtCore import QThread, pyqtSignal
-from main import process_netlist_to_excel
+
+from widgets.file_dialog import FILE_DIALOG_OPTIONS
+
+
+# Dark theme stylesheet, built once at import time
+DARK_STYLESHEET = """
+    QWidget {
+        background-color: #2e2e2e;
+        color: #f0f0f0;
+        font-family: "Microsoft YaHei", "微軟雅黑";
+    }
+    QLineEdit, QTextEdit {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QPushButton {
+        background-color: #555555;
+        border: 1px solid #666666;
+        padding: 8px 15px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #666666;
+    }
+    QPushButton:pressed {
+        background-color: #444444;
+    }
+    QLabel {
+        color: #f0f0f0;
+    }
+"""
 
 
 class ProcessingThread(QThread):
@@ -24,6 +56,9 @@ class ProcessingThread(QThread):
     
     def run(self):
         try:
+            # Imported here so pandas/openpyxl load on first use, not at startup
+            from main import process_netlist_to_excel
+            
             result_path = process_netlist_to_excel(
                 netlist_path=Path(self.netlist_path),
                 output_path=Path(self.output_path) if self.output_path else None
@@ -86,39 +121,13 @@ class SimpleGUI(QWidget):
         self.setLayout(layout)
         
         # 套用深色主題
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2e2e2e;
-                color: #f0f0f0;
-                font-family: "Microsoft YaHei", "微軟雅黑";
-            }
-            QLineEdit, QTextEdit {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton {
-                background-color: #555555;
-                border: 1px solid #666666;
-                padding: 8px 15px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #666666;
-            }
-            QPushButton:pressed {
-                background-color: #444444;
-            }
-            QLabel {
-                color: #f0f0f0;
-            }
-        """)
+        self.setStyleSheet(DARK_STYLESHEET)
     
     def browse_netlist(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "選擇 Netlist 檔案", "", 
-            "Netlist Files (*.net *.sp *.cir *.txt);;All Files (*)"
+            "Netlist Files (*.net *.sp *.cir *.txt);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             self.netlist_input.setText(file_path)
@@ -126,7 +135,8 @@ class SimpleGUI(QWidget):
     def browse_output(self):
         file_path, _ = QFileDialog.getSaveFileName(
             self, "儲存 Excel 檔案", "", 
-            "Excel Files (*.xlsx);;All Files (*)"
+            "Excel Files (*.xlsx);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             if not file_path.endswith('.xlsx'):
@@ -148,8 +158,8 @@ class SimpleGUI(QWidget):
         # 禁用按鈕，開始處理
         self.generate_button.setEnabled(False)
         self.generate_button.setText("處理中...")
-        self.status_text.clear()
-        self.status_text.append("🚀 開始處理 Netlist 檔案...")
+        # Replace the document in one step rather than clear() + append()
+        self.status_text.setPlainText("🚀 開始處理 Netlist 檔案...")
         
         # 啟動後台處理
         self.processing_thread = ProcessingThread(netlist_path, output_path)
@@ -158,8 +168,7 @@ class SimpleGUI(QWidget):
         self.processing_thread.start()
     
     def on_processing_finished(self, result_path):
-        self.status_text.append(f"✅ 處理完成!")
-        self.status_text.append(f"📄 輸出檔案: {result_path}")
+        self.status_text.append(f"✅ 處理完成!\n📄 輸出檔案: {result_path}")
         
         # 重新啟用按鈕
         self.generate_button.setEnabled(True)
@@ -334,25 +334,31 @@ class LayoutRuleEditor(QWidget):
     
     def refresh_rules_list(self):
         """Refresh the rules list table"""
-        self.rules_table.setRowCount(len(self.layout_rules))
+        # Repaint once after all rows are filled
+        self.rules_table.setUpdatesEnabled(False)
         
-        for row, (rule_name, rule) in enumerate(self.layout_rules.items()):
-            # Rule name
-            name_item = QTableWidgetItem(rule_name)
-            self.rules_table.setItem(row, 0, name_item)
-            
-            # Impedance
-            impedance_item = QTableWidgetItem(rule.impedance)
-            self.rules_table.setItem(row, 1, impedance_item)
-            
-            # Width
-            width_item = QTableWidgetItem(rule.width)
-            self.rules_table.setItem(row, 2, width_item)
+        try:
+            self.rules_table.setRowCount(len(self.layout_rules))
             
-            # Description (truncated)
-            desc_text = rule.description[:50] + "..." if len(rule.description) > 50 else rule.description
-            desc_item = QTableWidgetItem(desc_text)
-            self.rules_table.setItem(row, 3, desc_item)
+            for row, (rule_name, rule) in enumerate(self.layout_rules.items()):
+                # Rule name
+                name_item = QTableWidgetItem(rule_name)
+                self.rules_table.setItem(row, 0, name_item)
+                
+                # Impedance
+                impedance_item = QTableWidgetItem(rule.impedance)
+                self.rules_table.setItem(row, 1, impedance_item)
+                
+                # Width
+                width_item = QTableWidgetItem(rule.width)
+                self.rules_table.setItem(row, 2, width_item)
+                
+                # Description (truncated)
+                desc_text = rule.description[:50] + "..." if len(rule.description) > 50 else rule.description
+                desc_item = QTableWidgetItem(desc_text)
+                self.rules_table.setItem(row, 3, desc_item)
+        finally:
+            self.rules_table.setUpdatesEnabled(True)
         
         # Update button states
         self.update_button_states()
@@ -14,8 +14,10 @@ from PyQt5.QtCore import QThread, pyqtSignal
 from models.configuration_model import ConfigurationModel
 from controllers.configuration_controller import ConfigurationController
 from widgets.tooltip_widget import add_tooltip, TOOLTIP_TEXTS
+from widgets.file_dialog import FILE_DIALOG_OPTIONS
 
-# Import the main processing function
+# Make the main processing module importable; it is imported lazily in
+# NetlistProcessingThread.run so pandas/openpyxl are not loaded at startup.
 # Handle both development and PyInstaller environments
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     # Running in PyInstaller bundle - src is already in sys.path
@@ -23,7 +25,6 @@ if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
 else:
     # Running in development
     sys.path.append(str(Path(__file__).parent.parent))
-from main import process_netlist_to_excel
 
 
 class NetlistProcessingThread(QThread):
@@ -42,6 +43,8 @@ class NetlistProcessingThread(QThread):
         try:
             self.progress.emit("開始處理 Netlist...")
             
+            from main import process_netlist_to_excel
+            
             # Save current config to temporary file for processing
             import tempfile
             with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as temp_config:
@@ -156,7 +159,8 @@ class NetlistProcessor(QWidget):
         """Browse for netlist file"""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "選擇 Netlist 檔案", "",
-            "Netlist Files (*.net *.sp *.cir *.txt);;All Files (*)"
+            "Netlist Files (*.net *.sp *.cir *.txt);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             self.netlist_input.setText(file_path)
@@ -165,7 +169,8 @@ class NetlistProcessor(QWidget):
         """Browse for output file"""
         file_path, _ = QFileDialog.getSaveFileName(
             self, "儲存 Excel 檔案", "",
-            "Excel Files (*.xlsx);;All Files (*)"
+            "Excel Files (*.xlsx);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         if file_path:
             if not file_path.endswith('.xlsx'):
@@ -189,11 +194,12 @@ class NetlistProcessor(QWidget):
         # Validate configuration first
         errors = self.config_model.validate_config()
         if errors:
-            self.status_text.append("❌ 配置驗證失敗:")
-            for error in errors[:5]:  # Show first 5 errors
-                self.status_text.append(f"  • {error}")
+            # Build the report first so the status view is laid out once
+            lines = ["❌ 配置驗證失敗:"]
+            lines.extend(f"  • {error}" for error in errors[:5])  # Show first 5 errors
             if len(errors) > 5:
-                self.status_text.append(f"  ... 還有 {len(errors) - 5} 個錯誤")
+                lines.append(f"  ... 還有 {len(errors) - 5} 個錯誤")
+            self.status_text.append("\n".join(lines))
             return
         
         # Disable UI during processing
@@ -202,8 +208,8 @@ class NetlistProcessor(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
-        self.status_text.clear()
-        self.status_text.append("🚀 開始處理 Netlist 檔案...")
+        # Replace the document in one step rather than clear() + append()
+        self.status_text.setPlainText("🚀 開始處理 Netlist 檔案...")
         
         # Start background processing
         self.processing_thread = NetlistProcessingThread(
@@ -216,8 +222,7 @@ class NetlistProcessor(QWidget):
     
     def on_processing_finished(self, output_file):
         """Handle processing completion"""
-        self.status_text.append("✅ 處理完成!")
-        self.status_text.append(f"📄 輸出檔案: {output_file}")
+        self.status_text.append(f"✅ 處理完成!\n📄 輸出檔案: {output_file}")
         
         # Re-enable UI
         self.process_btn.setEnabled(True)
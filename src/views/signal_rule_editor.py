@@ -213,13 +213,19 @@ class SignalRuleEditor(QWidget):
     
     def refresh_rules_list(self):
         """Refresh the rules list table"""
-        self.rules_table.setRowCount(len(self.signal_rules))
+        # Repaint once after all rows are filled
+        self.rules_table.setUpdatesEnabled(False)
         
-        for row, (rule_name, rule) in enumerate(self.signal_rules.items()):
-            self.rules_table.setItem(row, 0, QTableWidgetItem(rule_name))
-            self.rules_table.setItem(row, 1, QTableWidgetItem(rule.category))
-            self.rules_table.setItem(row, 2, QTableWidgetItem(rule.signal_type))
-            self.rules_table.setItem(row, 3, QTableWidgetItem(str(rule.priority)))
+        try:
+            self.rules_table.setRowCount(len(self.signal_rules))
+            
+            for row, (rule_name, rule) in enumerate(self.signal_rules.items()):
+                self.rules_table.setItem(row, 0, QTableWidgetItem(rule_name))
+                self.rules_table.setItem(row, 1, QTableWidgetItem(rule.category))
+                self.rules_table.setItem(row, 2, QTableWidgetItem(rule.signal_type))
+                self.rules_table.setItem(row, 3, QTableWidgetItem(str(rule.priority)))
+        finally:
+            self.rules_table.setUpdatesEnabled(True)
     
     def on_rule_selected(self):
         """Handle rule selection"""
@@ -18,6 +18,7 @@ from pathlib import Path
 from models.template_mapping_model import TemplateMappingModel
 from controllers.template_mapping_controller import TemplateMappingController
 from widgets.tooltip_widget import add_tooltip, TOOLTIP_TEXTS
+from widgets.file_dialog import FILE_DIALOG_OPTIONS
 
 
 class ColumnMappingTableModel(QAbstractTableModel):
@@ -658,7 +659,8 @@ class TemplateMappingEditor(QWidget):
     def import_template(self):
         """Import template configuration from file"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "匯入模板配置", "", "JSON Files (*.json);;All Files (*)"
+            self, "匯入模板配置", "", "JSON Files (*.json);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         if not file_path:
@@ -680,7 +682,8 @@ class TemplateMappingEditor(QWidget):
     def export_template(self):
         """Export template configuration to file"""
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "匯出模板配置", "template_config.json", "JSON Files (*.json);;All Files (*)"
+            self, "匯出模板配置", "template_config.json", "JSON Files (*.json);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         
         if not file_path:
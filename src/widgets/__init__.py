@@ -5,9 +5,11 @@ Custom widgets package for the advanced impedance control GUI
 
 from .tooltip_widget import ToolTipWidget, add_tooltip
 from .help_panel import HelpPanel
+from .file_dialog import FILE_DIALOG_OPTIONS
 
 __all__ = [
     'ToolTipWidget',
     'add_tooltip',
-    'HelpPanel'
+    'HelpPanel',
+    'FILE_DIALOG_OPTIONS'
 ]
@@ -0,0 +1,9 @@
+"""
+Shared options for file dialogs
+檔案對話框的共用選項
+"""
+
+from PyQt5.QtWidgets import QFileDialog
+
+# Skip per-entry custom directory icon lookups, which stat every sibling on slow file systems
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons
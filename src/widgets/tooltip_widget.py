@@ -6,15 +6,75 @@ Custom tooltip widget with enhanced functionality
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QGraphicsDropShadowEffect
 from PyQt5.QtCore import QTimer, QPoint, Qt, pyqtSignal
 from PyQt5.QtGui import QPalette, QFont, QColor
+from PyQt5 import sip
 import typing
 
 
+# Tooltip theme stylesheets, built once at import time
+# Dark theme with high contrast
+_DARK_QSS = """
+    ToolTipWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #505050, stop:1 #404040);
+        border: 2px solid #707070;
+        border-radius: 10px;
+        color: #ffffff;
+    }
+    QLabel {
+        background-color: transparent;
+        color: #ffffff;
+        padding: 8px;
+        line-height: 1.5;
+    }
+"""
+
+# Light theme for better contrast
+_LIGHT_QSS = """
+    ToolTipWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f8f8f8, stop:1 #e8e8e8);
+        border: 2px solid #cccccc;
+        border-radius: 10px;
+        color: #333333;
+    }
+    QLabel {
+        background-color: transparent;
+        color: #333333;
+        padding: 8px;
+        line-height: 1.5;
+    }
+"""
+
+# Blue accent theme
+_BLUE_QSS = """
+    ToolTipWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4a90e2, stop:1 #357abd);
+        border: 2px solid #5ba0f2;
+        border-radius: 10px;
+        color: #ffffff;
+    }
+    QLabel {
+        background-color: transparent;
+        color: #ffffff;
+        padding: 8px;
+        line-height: 1.5;
+    }
+"""
+
+
 class ToolTipWidget(QWidget):
     """
     Custom tooltip widget with rich formatting and delayed display
     支援豐富格式化和延遲顯示的自定義工具提示元件
     """
     
+    _THEME_QSS = {
+        'dark': _DARK_QSS,
+        'light': _LIGHT_QSS,
+        'blue': _BLUE_QSS
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent, Qt.ToolTip)
         self.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
@@ -38,6 +98,9 @@ class ToolTipWidget(QWidget):
         self.tooltip_text = ""
         self.show_delay = 500  # 0.5 seconds
         self.hide_delay = 5000  # 5 seconds
+        
+        # Per-widget payloads (text, show_delay, theme) so one tooltip can serve many widgets
+        self.targets = {}
     
     def init_ui(self):
         """Initialize the tooltip UI"""
@@ -68,76 +131,9 @@ class ToolTipWidget(QWidget):
     
     def apply_theme_style(self, theme='dark'):
         """Apply theme-based styling to the tooltip"""
-        if theme == 'dark':
-            # Dark theme with high contrast
-            style = """
-                ToolTipWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #505050, stop:1 #404040);
-                    border: 2px solid #707070;
-                    border-radius: 10px;
-                    color: #ffffff;
-                }
-                QLabel {
-                    background-color: transparent;
-                    color: #ffffff;
-                    padding: 8px;
-                    line-height: 1.5;
-                }
-            """
-        elif theme == 'light':
-            # Light theme for better contrast
-            style = """
-                ToolTipWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #f8f8f8, stop:1 #e8e8e8);
-                    border: 2px solid #cccccc;
-                    border-radius: 10px;
-                    color: #333333;
-                }
-                QLabel {
-                    background-color: transparent;
-                    color: #333333;
-                    padding: 8px;
-                    line-height: 1.5;
-                }
-            """
-        elif theme == 'blue':
-            # Blue accent theme
-            style = """
-                ToolTipWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #4a90e2, stop:1 #357abd);
-                    border: 2px solid #5ba0f2;
-                    border-radius: 10px;
-                    color: #ffffff;
-                }
-                QLabel {
-                    background-color: transparent;
-                    color: #ffffff;
-                    padding: 8px;
-                    line-height: 1.5;
-                }
-            """
-        else:
-            # Default dark theme
-            style = """
-                ToolTipWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #505050, stop:1 #404040);
-                    border: 2px solid #707070;
-                    border-radius: 10px;
-                    color: #ffffff;
-                }
-                QLabel {
-                    background-color: transparent;
-                    color: #ffffff;
-                    padding: 8px;
-                    line-height: 1.5;
-                }
-            """
-        
-        self.setStyleSheet(style)
+        self.current_theme = theme
+        # Unknown themes fall back to the default dark theme
+        self.setStyleSheet(self._THEME_QSS.get(theme, _DARK_QSS))
     
     def add_shadow_effect(self):
         """Add drop shadow effect to the tooltip"""
@@ -148,11 +144,13 @@ class ToolTipWidget(QWidget):
         shadow.setColor(QColor(0, 0, 0, 150))  # 陰影顏色（黑色，透明度150）
         self.setGraphicsEffect(shadow)
     
-    def set_tooltip_for_widget(self, widget: QWidget, text: str, show_delay: int = 500):
+    def set_tooltip_for_widget(self, widget: QWidget, text: str, show_delay: int = 500,
+                               theme: typing.Optional[str] = None):
         """
         Set tooltip for a specific widget
         為特定元件設定工具提示
         """
+        self.targets[widget] = (text, show_delay, theme)
         self.target_widget = widget
         self.tooltip_text = text
         self.show_delay = show_delay
@@ -160,12 +158,29 @@ class ToolTipWidget(QWidget):
         # Install event filter on target widget
         widget.installEventFilter(self)
     
+    def remove_target(self, widget: QWidget):
+        """
+        Stop serving tooltips for a widget
+        停止為元件顯示工具提示
+        """
+        widget.removeEventFilter(self)
+        self.targets.pop(widget, None)
+        if self.target_widget is widget:
+            self.target_widget = None
+    
     def eventFilter(self, obj, event):
-        """Handle events for target widget"""
-        if obj == self.target_widget:
-            if event.type() == event.Enter:
+        """Handle events for target widgets"""
+        if event.type() == event.Enter:
+            payload = self.targets.get(obj)
+            if payload is not None:
+                # Re-fill the shared tooltip with this widget's content
+                self.target_widget = obj
+                self.tooltip_text, self.show_delay, theme = payload
+                if theme and theme != self.current_theme:
+                    self.apply_theme_style(theme)
                 self.on_enter()
-            elif event.type() == event.Leave:
+        elif obj == self.target_widget:
+            if event.type() == event.Leave:
                 self.on_leave()
             elif event.type() == event.MouseMove:
                 self.update_position(event.globalPos())
@@ -282,33 +297,42 @@ class TooltipManager:
     """
     Global tooltip manager to handle multiple tooltips
     全域工具提示管理器
+    
+    All registered widgets share a single ToolTipWidget, which is created on
+    first use and re-filled with the hovered widget's text and theme.
     """
     
     def __init__(self):
         self.tooltips = {}
         self.current_tooltip = None
     
+    def _get_shared_tooltip(self) -> ToolTipWidget:
+        """Return the shared tooltip, creating it if needed"""
+        if self.current_tooltip is None or sip.isdeleted(self.current_tooltip):
+            self.current_tooltip = ToolTipWidget()
+            self.tooltips.clear()
+        return self.current_tooltip
+    
     def add_tooltip(self, widget: QWidget, text: str, show_delay: int = 500, theme: str = 'dark'):
         """Add tooltip to a widget"""
-        tooltip = ToolTipWidget()
-        tooltip.apply_theme_style(theme)  # Apply theme before setting up
-        tooltip.set_tooltip_for_widget(widget, text, show_delay)
+        tooltip = self._get_shared_tooltip()
+        tooltip.set_tooltip_for_widget(widget, text, show_delay, theme)
         self.tooltips[widget] = tooltip
     
     def remove_tooltip(self, widget: QWidget):
         """Remove tooltip from a widget"""
         if widget in self.tooltips:
-            tooltip = self.tooltips[widget]
-            widget.removeEventFilter(tooltip)
-            tooltip.deleteLater()
-            del self.tooltips[widget]
+            tooltip = self.tooltips.pop(widget)
+            tooltip.remove_target(widget)
     
     def clear_all(self):
         """Clear all tooltips"""
         for widget, tooltip in self.tooltips.items():
             widget.removeEventFilter(tooltip)
-            tooltip.deleteLater()
         self.tooltips.clear()
+        if self.current_tooltip is not None and not sip.isdeleted(self.current_tooltip):
+            self.current_tooltip.deleteLater()
+        self.current_tooltip = None
 
 
 # Global tooltip manager instance
@@ -2,6 +2,9 @@
 Tests for configuration validation and handling.
 """
 import pytest
+import yaml
+
+from src.config.config_manager import ConfigManager, ConfigurationError
 
 
 class TestConfiguration:
@@ -11,21 +14,97 @@ class TestConfiguration:
         """Test loading of valid configuration data."""
         pass
     
-    def test_invalid_config_handling(self):
+    def test_invalid_config_handling(self, tmp_path):
         """Test handling of invalid configuration data."""
-        pass
+        config_file = tmp_path / "invalid.yaml"
+        config_file.write_text(
+            "net_classification_rules:\n"
+            "  I2C:\n"
+            "    category: Communication Interface\n"
+            "    signal_type: Single-End\n"
+            "layout_rules: {}\n"
+            "template_mapping:\n"
+            "  columns: {}\n",
+            encoding='utf-8'
+        )
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigManager(config_file).load_config()
+        
+        assert "line 3: net_classification_rules.I2C: 'priority' is a required property" in str(exc_info.value)
     
     def test_missing_config_sections(self):
         """Test handling of missing configuration sections."""
-        pass
+        manager = ConfigManager()
+        config = {
+            'net_classification_rules': {'I2C': {'category': 'Communication Interface'}},
+            'layout_rules': {}
+        }
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            manager._validate_config(config)
+        
+        message = str(exc_info.value)
+        assert "'template_mapping' is a required property" in message
+        assert "net_classification_rules.I2C: 'priority' is a required property" in message
     
     def test_config_schema_validation(self, config_data):
         """Test configuration schema validation."""
         pass
     
-    def test_default_config_fallback(self):
+    def test_default_config_fallback(self, tmp_path):
         """Test fallback to default configuration."""
-        pass
+        cm = ConfigManager(tmp_path / "missing.yaml")
+        config = cm.load_config()
+        assert "net_classification_rules" in config
+        assert "layout_rules" in config
+    
+    def test_cached_config_is_private_and_refreshed(self, tmp_path):
+        """Test cached parses are copied per instance and dropped on change."""
+        config_data = ConfigManager().load_config()
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.safe_dump(config_data), encoding="utf-8")
+        
+        first = ConfigManager(config_path).load_config()
+        first["layout_rules"]["I2C"]["impedance"] = "mutated"
+        second = ConfigManager(config_path).load_config()
+        assert second["layout_rules"]["I2C"]["impedance"] == config_data["layout_rules"]["I2C"]["impedance"]
+        
+        config_data["layout_rules"]["I2C"]["impedance"] = "75 Ohm"
+        config_path.write_text(yaml.safe_dump(config_data), encoding="utf-8")
+        cm = ConfigManager(config_path)
+        cm.invalidate_cache()
+        assert cm.load_config()["layout_rules"]["I2C"]["impedance"] == "75 Ohm"
+    
+    def test_get_value_reflects_updates(self):
+        """Test dot-path lookups stay current after configuration changes."""
+        manager = ConfigManager()
+        manager.load_config()
+        
+        assert manager.get_value('layout_rules.I2C.impedance') is not None
+        assert manager.get_value('layout_rules.I2C.missing', 'fallback') == 'fallback'
+        
+        manager.update_config({'layout_rules': {'I2C': {'impedance': '42 ohm'}}})
+        assert manager.get_value('layout_rules.I2C.impedance') == '42 ohm'
+        
+        manager.config_data = {'layout_rules': {}}
+        assert manager.get_value('layout_rules.I2C.impedance', 'gone') == 'gone'
+    
+    def test_save_config_round_trip(self, tmp_path):
+        """Test saved configuration reloads unchanged and leaves no temp file."""
+        manager = ConfigManager()
+        config = manager.load_config()
+        
+        output_path = tmp_path / "saved.yaml"
+        manager.save_config(output_path)
+        
+        assert list(tmp_path.iterdir()) == [output_path]
+        assert ConfigManager(output_path).load_config() == config
+        
+        # Keys are written sorted, as before the atomic save
+        top_level_keys = [line.split(':')[0] for line in output_path.read_text(encoding='utf-8').splitlines()
+                          if line and not line[0].isspace()]
+        assert top_level_keys == sorted(top_level_keys)
     
     def test_config_file_formats(self):
         """Test support for different config file formats (JSON, YAML)."""
@@ -70,6 +70,12 @@ def config_data():
         }
     }
 
+@pytest.fixture
+def qapp():
+    """Qt application instance for tests that use Qt objects and signals."""
+    from PyQt5.QtCore import QCoreApplication
+    return QCoreApplication.instance() or QCoreApplication([])
+
 @pytest.fixture
 def sample_netlist_content():
     """Sample netlist file content for testing."""
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+# Add src directory to path for model and controller imports
+base_path = Path(__file__).resolve().parents[2] / "src"
+sys.path.append(str(base_path))
+
+from controllers.configuration_controller import ConfigurationController
+from models.configuration_model import ConfigurationModel
+
+
+def make_controller():
+    model = ConfigurationModel()
+    return model, ConfigurationController(model)
+
+
+def test_undo_redo_restore_snapshots(qapp):
+    model, controller = make_controller()
+
+    model.add_signal_rule("RULE_A")
+    controller._flush_pending_snapshot()
+    model.add_signal_rule("RULE_B")
+    controller._flush_pending_snapshot()
+    assert all(isinstance(state, bytes) for state in controller.undo_stack)
+
+    assert controller.undo()
+    assert controller.undo()
+    assert "RULE_A" in model.signal_rules
+    assert "RULE_B" not in model.signal_rules
+
+    assert controller.redo()
+    assert "RULE_B" in model.signal_rules
+
+
+def test_snapshot_is_isolated_from_later_edits(qapp):
+    model, controller = make_controller()
+
+    model.app_info["version"] = "1.0"
+    model.dataChanged.emit()
+    controller._flush_pending_snapshot()
+    model.app_info["version"] = "2.0"
+
+    assert controller.undo()
+    assert model.app_info["version"] == "1.0"
+
+
+def test_undo_stack_is_bounded(qapp):
+    model, controller = make_controller()
+
+    for index in range(controller.max_undo_levels + 5):
+        model.add_signal_rule(f"RULE_{index}")
+        controller._flush_pending_snapshot()
+
+    assert len(controller.undo_stack) == controller.max_undo_levels
+
+
+def test_change_bursts_are_coalesced(qapp):
+    model, controller = make_controller()
+    controller._flush_pending_snapshot()
+    depth = len(controller.undo_stack)
+
+    for index in range(10):
+        model.add_signal_rule(f"RULE_{index}")
+    controller._flush_pending_snapshot()
+    assert len(controller.undo_stack) == depth + 1
+
+    # An unchanged state is not pushed again
+    model.dataChanged.emit()
+    controller._flush_pending_snapshot()
+    assert len(controller.undo_stack) == depth + 1
+
+
+def test_undo_redo_keeps_rule_level_edits(qapp):
+    model, controller = make_controller()
+    rule = model.add_signal_rule("RULE_A")
+    controller._flush_pending_snapshot()
+
+    # Rule-level edits do not emit ConfigurationModel.dataChanged
+    rule.set_category("EDITED")
+
+    assert controller.undo()
+    assert model.signal_rules["RULE_A"].category == ""
+    assert controller.redo()
+    assert model.signal_rules["RULE_A"].category == "EDITED"
+
+
+def test_repeated_states_share_one_payload(qapp):
+    model, controller = make_controller()
+
+    for _ in range(2):
+        model.add_signal_rule("RULE_A")
+        controller._flush_pending_snapshot()
+        model.remove_signal_rule("RULE_A")
+        controller._flush_pending_snapshot()
+
+    assert len(controller.undo_stack) == 4
+    assert len(controller._snapshots) == 2
+
+    assert controller.undo()
+    assert controller.undo()
+    total_refs = sum(controller._snapshot_refs.values())
+    assert total_refs == len(controller.undo_stack) + len(controller.redo_stack)
@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+from PyQt5.QtCore import QCoreApplication
+
+# Add src directory to path for model and controller imports
+base_path = Path(__file__).resolve().parents[2] / "src"
+sys.path.append(str(base_path))
+
+from controllers.signal_rule_controller import SignalRuleController
+
+NETS = ["CLK_100M", "clk_ref", "DDR_DQ0", "DDR_DQ10", "USB_DP", "GND", "gnd", "AA_B", "XAAX"]
+
+
+def test_rule_test_matches_matches_net():
+    app = QCoreApplication.instance() or QCoreApplication([])
+    controller = SignalRuleController({})
+    controller.add_rule("RULE", {
+        "keywords": ["clk"],
+        "patterns": [r"^DDR_DQ\d$", "([", r"(A)\1_B"],
+        "exact_matches": ["gnd"],
+        "category": "Test",
+        "signal_type": "Single-End",
+    })
+    rule = controller.signal_rules["RULE"]
+
+    expected = [net for net in NETS if rule.matches_net(net)]
+    assert controller.test_rule_against_nets("RULE", NETS) == expected
+
+    rule.patterns = [r"^USB_"]
+    rule.dataChanged.emit()
+    assert controller.test_rule_against_nets("RULE", NETS) == ["CLK_100M", "clk_ref", "USB_DP", "GND", "gnd"]
+
+    rule.set_enabled(False)
+    assert controller.test_rule_against_nets("RULE", NETS) == []
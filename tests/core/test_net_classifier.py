@@ -1,4 +1,6 @@
 """Tests for the NetClassifier using ConfigManager rules."""
+import copy
+
 from src.core.net_classifier import NetClassifier
 from src.config.config_manager import ConfigManager
 
@@ -16,3 +18,128 @@ class TestNetClassifier:
         assert results["I2C_SCL"]["signal_type"] == "I2C"
         assert results["UNKNOWN_NET"]["category"] == "Other"
 
+    def test_exact_match_is_case_insensitive(self, config_data):
+        """Test that exact matches ignore case but not extra characters."""
+        cm = ConfigManager()
+        cm.config_data = copy.deepcopy(config_data)
+        classifier = NetClassifier(cm)
+        classifier.add_custom_rule("Reset", {
+            "exact_matches": ["Sys_Reset"],
+            "category": "Control",
+            "signal_type": "Single-End",
+        })
+
+        results = classifier.classify(["SYS_RESET", "SYS_RESET_N"])
+
+        assert results["SYS_RESET"]["rule_matched"] == "Reset"
+        assert results["SYS_RESET_N"]["rule_matched"] == "default"
+
+    def test_invalid_pattern_is_skipped(self, config_data, caplog):
+        """Test that an invalid pattern is logged once and the others still match."""
+        cm = ConfigManager()
+        cm.config_data = copy.deepcopy(config_data)
+        classifier = NetClassifier(cm)
+        classifier.add_custom_rule("Broken", {
+            "patterns": ["(unclosed", "^DBGQ"],
+            "category": "Debug",
+            "signal_type": "Single-End",
+        })
+
+        results = classifier.classify(["DBGQ0", "DBGQ9", "OTHER"])
+
+        assert results["DBGQ0"]["rule_matched"] == "Broken"
+        assert results["DBGQ9"]["rule_matched"] == "Broken"
+        assert results["OTHER"]["rule_matched"] == "default"
+        assert sum("Invalid regex pattern" in r.getMessage() for r in caplog.records) == 1
+
+    def test_compiled_patterns_match_like_search(self, config_data):
+        """Test that literal, fused and back-reference patterns match like re.search."""
+        cm = ConfigManager()
+        cm.config_data = copy.deepcopy(config_data)
+        classifier = NetClassifier(cm)
+        classifier.add_custom_rule("Mixed", {
+            "patterns": [".*qzx.*", "^LANE[0-9]+$", r"^(JK)_\1$"],
+            "category": "Test",
+            "signal_type": "Single-End",
+        })
+
+        results = classifier.classify(["A_QZX_B", "lane12", "LANE12_X", "JK_JK", "JK_KJ"])
+
+        assert results["A_QZX_B"]["rule_matched"] == "Mixed"
+        assert results["lane12"]["rule_matched"] == "Mixed"
+        assert results["LANE12_X"]["rule_matched"] == "default"
+        assert results["JK_JK"]["rule_matched"] == "Mixed"
+        assert results["JK_KJ"]["rule_matched"] == "default"
+
+    def test_custom_rule_invalidates_cached_matches(self, config_data):
+        """Test that adding a custom rule drops cached matches."""
+        cm = ConfigManager()
+        cm.config_data = copy.deepcopy(config_data)
+        classifier = NetClassifier(cm)
+
+        assert classifier.classify(["QZ_NET"])["QZ_NET"]["rule_matched"] == "default"
+
+        classifier.add_custom_rule("QZ", {
+            "keywords": ["QZ"],
+            "category": "Test",
+            "signal_type": "Single-End",
+        })
+
+        assert classifier.classify(["QZ_NET"])["QZ_NET"]["rule_matched"] == "QZ"
+
+    def test_results_are_shared_per_rule(self, config_data):
+        """Test that nets matching the same rule share one classification."""
+        cm = ConfigManager()
+        cm.config_data = config_data
+        classifier = NetClassifier(cm)
+
+        results = classifier.classify(["I2C_SCL", "I2C_SDA", "UNKNOWN_NET"])
+
+        assert results["I2C_SCL"] is results["I2C_SDA"]
+        assert results["I2C_SCL"].signal_type == results["I2C_SCL"]["signal_type"]
+        assert results["UNKNOWN_NET"].get("missing", "fallback") == "fallback"
+        assert results["UNKNOWN_NET"].to_dict() == {
+            "category": "Other",
+            "signal_type": "Single-End",
+            "rule_matched": "default",
+            "priority": 999,
+        }
+
+    def test_rule_added_through_config_manager_is_classified(self):
+        """Test that rules added through the config manager are used."""
+        cm = ConfigManager()
+        cm.load_config()
+        classifier = NetClassifier(cm)
+
+        cm.update_config({"net_classification_rules": {"ZZNEW": {
+            "keywords": ["ZZQQ"],
+            "category": "Test",
+            "signal_type": "Single-End",
+            "priority": 1,
+        }}})
+
+        result = classifier.classify(["ZZQQ_1"])["ZZQQ_1"]
+        assert result.rule_matched == "ZZNEW"
+        assert result.category == "Test"
+
+    def test_config_update_invalidates_cached_matches(self):
+        """Test that config manager updates drop cached matches."""
+        cm = ConfigManager()
+        cm.load_config()
+        classifier = NetClassifier(cm)
+
+        assert classifier.classify(["ZZQQ_1"])["ZZQQ_1"].rule_matched == "default"
+
+        cm.update_config({"net_classification_rules": {"ZZNEW": {
+            "patterns": ["^ZZQQ_"],
+            "category": "Test",
+            "signal_type": "Single-End",
+            "priority": 1,
+        }}})
+        assert classifier.classify(["ZZQQ_1"])["ZZQQ_1"].rule_matched == "ZZNEW"
+
+        cm.update_config({"net_classification_rules": {"ZZNEW": {"category": "Changed"}}})
+        assert classifier.classify(["ZZQQ_1"])["ZZQQ_1"].category == "Changed"
+
+        cm.load_config()
+        assert classifier.classify(["ZZQQ_1"])["ZZQQ_1"].rule_matched == "default"
@@ -77,8 +77,9 @@ class TestNetlistParser:
 
     def test_filter_excluded_components(self, parser):
         """Test filtering of excluded component identifiers."""
-        names = ["R123", "NET_A", "10ohm", "C456", "SIGNAL_1"]
-        assert parser._filter_excluded_names(names) == ["NET_A", "SIGNAL_1"]
+        content = "\n".join(f"{index} {name} R1" for index, name in
+                             enumerate(["R123", "NET_A", "10ohm", "C456", "SIGNAL_1"], 1))
+        assert parser._extract_net_names(content) == ["NET_A", "SIGNAL_1"]
 
     def test_parse_large_netlist(self, parser, netlist_file, large_netlist):
         """Test parsing performance with large netlist files."""
@@ -88,3 +89,9 @@ class TestNetlistParser:
         assert "TEST_NET_0" in result
         assert "TEST_NET_999" in result
 
+    def test_is_excluded_word(self, parser):
+        """Test the fused exclusion pattern against each excluded form."""
+        for word in ["R123", "c45", "100", "10ohm", "22F", "1h"]:
+            assert parser._is_excluded_word(word)
+        for word in ["NET_A", "I2C_SCL", "R12A", "10uF", ""]:
+            assert not parser._is_excluded_word(word)
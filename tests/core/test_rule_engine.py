@@ -1,6 +1,10 @@
 """Tests for the RuleEngine using ConfigManager rules."""
+import copy
+
+import pytest
+
 from src.core.net_classifier import NetClassifier
-from src.core.rule_engine import RuleEngine
+from src.core.rule_engine import LayoutInfo, RuleEngine
 from src.config.config_manager import ConfigManager
 
 
@@ -19,3 +23,101 @@ class TestRuleEngine:
 
         assert layout["SPI_MOSI"]["impedance"] == "50 Ohm"
 
+    def test_custom_rule_replaces_cached_lookup(self, config_data):
+        """Test that a custom rule replaces the cached lookup for its signal type."""
+        cm = ConfigManager()
+        cm.config_data = copy.deepcopy(config_data)
+
+        classified = NetClassifier(cm).classify(["SPI_MOSI"])
+        engine = RuleEngine(cm)
+        engine.apply_rules(classified)
+
+        engine.add_custom_rule("SPI", {"impedance": "40 Ohm", "description": "Custom SPI"})
+
+        assert engine.apply_rules(classified)["SPI_MOSI"]["impedance"] == "40 Ohm"
+
+    def test_layout_info_supports_item_access(self, config_data):
+        """Test that LayoutInfo results behave like the former per-net dicts."""
+        cm = ConfigManager()
+        cm.config_data = config_data
+
+        classified = NetClassifier(cm).classify(["SPI_MOSI"])
+        info = RuleEngine(cm).apply_rules(classified)["SPI_MOSI"]
+
+        assert isinstance(info, LayoutInfo)
+        assert info.get("net_name") == "SPI_MOSI"
+        assert info.get("missing", "default") == "default"
+        assert info.to_dict()["impedance"] == info["impedance"]
+        assert "notes" in info and "missing" not in info
+        assert dict(info) == info.to_dict()
+
+        info["notes"] = "Edited"
+        assert info.notes == "Edited"
+        with pytest.raises(KeyError):
+            info["missing"] = "value"
+
+    def test_default_config_manager_is_shared(self):
+        """Test that engines share the default config manager but not custom rules."""
+        first = RuleEngine()
+        second = RuleEngine()
+        assert first.config_manager is second.config_manager
+
+        first.add_custom_rule("CUSTOM", {"impedance": "40 Ohm", "description": "Custom"})
+        assert "CUSTOM" not in second.layout_rules
+        assert "CUSTOM" not in RuleEngine().layout_rules
+
+    def test_default_layout_rules_are_shared_until_modified(self):
+        """Test that default layout rules are copied only when an engine modifies them."""
+        first = RuleEngine()
+        second = RuleEngine()
+        assert first.layout_rules is second.layout_rules
+
+        first.add_custom_rule("CUSTOM", {"impedance": "40 Ohm", "description": "Custom"})
+        assert first.layout_rules is not second.layout_rules
+        assert "CUSTOM" in first.layout_rules
+
+    def test_validate_rule_config_reports_missing_fields(self, caplog):
+        """Test that rule validation logs every missing required field."""
+        engine = RuleEngine()
+
+        assert engine.validate_rule_config({"impedance": "50 Ohm", "description": "Signal"})
+        assert not engine.validate_rule_config({"width": "5 mil"})
+        assert "['description', 'impedance']" in caplog.text
+
+    def test_layout_rules_are_fetched_on_first_use(self, config_data):
+        """Test that layout rules are read from the config manager lazily."""
+        cm = ConfigManager()
+        engine = RuleEngine(cm)
+        assert cm.config_data == {}
+
+        cm.config_data = config_data
+        assert engine.layout_rules is cm.get_layout_rules()
+
+    def test_apply_rules_accepts_dict_classifications(self):
+        """Test that dict classifications are accepted and defaulted."""
+        cm = ConfigManager()
+        cm.config_data = {"layout_rules": {"SPI": {"impedance": "45 Ohm", "description": "SPI"}}}
+
+        layout = RuleEngine(cm).apply_rules({"X": {"signal_type": "SPI"}, "Y": {}})
+
+        assert layout["X"]["impedance"] == "45 Ohm"
+        assert layout["X"]["category"] == "Other"
+        assert layout["Y"]["rule_matched"] == "default"
+        assert layout["Y"]["priority"] == 999
+
+    def test_config_update_invalidates_cached_rules(self):
+        """Test that config manager updates reach an existing engine."""
+        cm = ConfigManager()
+        cm.load_config()
+        classified = NetClassifier(cm).classify(["SPI_MOSI"])
+        engine = RuleEngine(cm)
+        engine.add_custom_rule("CUSTOM", {"impedance": "40 Ohm", "description": "Custom"})
+        original = engine.apply_rules(classified)["SPI_MOSI"]
+
+        cm.update_config({"layout_rules": {original.signal_type: {"impedance": "42 Ohm"}}})
+        assert engine.apply_rules(classified)["SPI_MOSI"]["impedance"] == "42 Ohm"
+
+        cm.config_data = {}
+        cm.load_config()
+        assert engine.apply_rules(classified)["SPI_MOSI"]["impedance"] == original.impedance
+        assert "CUSTOM" in engine.layout_rules
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+# Add src directory to path for model imports
+base_path = Path(__file__).resolve().parents[2] / "src"
+sys.path.append(str(base_path))
+
+from models.configuration_model import ConfigurationModel
+
+
+def test_config_round_trips_through_json(qapp, tmp_path):
+    model = ConfigurationModel()
+    json_path = tmp_path / "config.json"
+
+    assert model.save_config(json_path)
+    assert json_path.read_text(encoding="utf-8").lstrip().startswith("{")
+
+    reloaded = ConfigurationModel()
+    assert reloaded.load_config(json_path)
+    assert set(reloaded.signal_rules) == set(model.signal_rules)
+
+
+def test_yaml_read_cache_tracks_source_file(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("app_info:\n  version: '1.0'\n", encoding="utf-8")
+
+    first = ConfigurationModel.read_config_file(config_path)
+    first["app_info"]["version"] = "changed"
+    assert ConfigurationModel.read_config_file(config_path)["app_info"]["version"] == "1.0"
+    assert [path.name for path in tmp_path.iterdir()] == ["config.yaml"]
+
+    config_path.write_text("app_info:\n  version: '2.00'\n", encoding="utf-8")
+    assert ConfigurationModel.read_config_file(config_path)["app_info"]["version"] == "2.00"
+
+
+def test_config_round_trips_through_yaml(qapp, tmp_path):
+    model = ConfigurationModel()
+    yaml_path = tmp_path / "config.yaml"
+
+    assert model.save_config(yaml_path)
+    assert not (tmp_path / "config.yaml.tmp").exists()
+
+    reloaded = ConfigurationModel()
+    assert reloaded.load_config(yaml_path)
+    assert reloaded._build_config_data() == model._build_config_data()